@@ -1,13 +1,33 @@
 import os
 from dotenv import load_dotenv
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Mapping
 import json
 from pathlib import Path
+from functools import lru_cache
+from types import MappingProxyType
 from ..utils.logger import get_logger
 
 # Get logger instance
 logger = get_logger(__name__)
 
+# Default templates seeded into the database on first start
+DEFAULT_TEMPLATES_PATH = Path(__file__).parent / "default_templates.json"
+
+@lru_cache(maxsize=1)
+def load_default_templates() -> Mapping[str, Mapping[str, str]]:
+    """Load the default templates once per process.
+    
+    The result is shared by every caller, so it is returned as a read-only view.
+    
+    Returns:
+        Mapping[str, Mapping[str, str]]: Template name mapped to its type and content
+    """
+    with open(DEFAULT_TEMPLATES_PATH, 'r', encoding='utf-8') as f:
+        templates = json.load(f)
+    return MappingProxyType({
+        name: MappingProxyType(template) for name, template in templates.items()
+    })
+
 class ConfigManager:
     _instance: Optional['ConfigManager'] = None
     _initialized: bool = False
@@ -80,21 +100,6 @@ class ConfigManager:
                 }
             }
         
-        # UI Style Configuration
-        self.CSS = """
-            .feature-header { 
-                text-align: center !important;
-                margin: 20px 0 !important;
-                font-size: 24px !important;
-                font-weight: bold !important;
-            }
-            .feature-divider {
-                border-top: 2px solid #444 !important;
-                margin: 30px 0 !important;
-                opacity: 0.3 !important;
-            }
-        """
-        
         # Dropdown Choices
         self.STYLE_CHOICES = ["Minimal", "Detailed", "Summarized"]
         self.EXEMPLIFIED_CHOICES = ["Yes include examples", "No do not include examples"]
@@ -124,6 +129,25 @@ class ConfigManager:
             logger.error(f"Error loading templates from database: {e}")
             return {}
     
+    def get_template(self, name: str) -> Optional[Dict[str, Any]]:
+        """Get a single template by name without loading every template."""
+        try:
+            from ..utils.singletons import DatabaseInstance
+            template = DatabaseInstance.get_instance().get_template_by_name(name)
+            if not template:
+                return None
+            return {
+                'type': template['type'],
+                'structure': template['structure']
+            }
+        except Exception as e:
+            logger.error(f"Error loading template '{name}' from database: {e}")
+            return None
+    
+    def get_default_templates(self) -> Mapping[str, Mapping[str, str]]:
+        """Get the default templates shipped with the application."""
+        return load_default_templates()
+    
     @classmethod
     def get_instance(cls) -> 'ConfigManager':
         """Get the singleton instance of ConfigManager."""
@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from typing import List, Dict, Any, Union
 from ..utils.logger import get_logger
 from datetime import datetime
+import pandas as pd
 
 # Get logger instance
 logger = get_logger(__name__)
@@ -16,7 +17,32 @@ class LogEntry:
     cost: float
     output: str = None
 
+# Column headers of the token usage table
+LOG_TABLE_HEADERS = ["Time", "Function", "Prompt Tokens", "Completion Tokens", "Total Tokens", "Cost ($)"]
+
 class LogFormatter:
+    @staticmethod
+    def format_timestamp(timestamp: Any) -> str:
+        """
+        Formats a log timestamp for display.
+        
+        Args:
+            timestamp: Unix timestamp, datetime or ISO formatted string
+            
+        Returns:
+            Timestamp formatted as YYYY-MM-DD HH:MM:SS
+        """
+        if isinstance(timestamp, (int, float)):
+            # Convert Unix timestamp to datetime
+            return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
+        if isinstance(timestamp, datetime):
+            return timestamp.strftime("%Y-%m-%d %H:%M:%S")
+        # If it's already a string, try to parse it
+        try:
+            return datetime.fromisoformat(str(timestamp)).strftime("%Y-%m-%d %H:%M:%S")
+        except ValueError:
+            return str(timestamp)  # Fallback to string representation
+
     @staticmethod
     def format_for_display(logs: List[Dict[str, Any]]) -> List[List[Any]]:
         """
@@ -31,22 +57,8 @@ class LogFormatter:
         try:
             formatted_logs = []
             for log in logs:
-                # Handle timestamp formatting
-                timestamp = log['timestamp']
-                if isinstance(timestamp, (int, float)):
-                    # Convert Unix timestamp to datetime
-                    formatted_time = datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
-                elif isinstance(timestamp, datetime):
-                    formatted_time = timestamp.strftime("%Y-%m-%d %H:%M:%S")
-                else:
-                    # If it's already a string, try to parse it
-                    try:
-                        formatted_time = datetime.fromisoformat(str(timestamp)).strftime("%Y-%m-%d %H:%M:%S")
-                    except ValueError:
-                        formatted_time = str(timestamp)  # Fallback to string representation
-                
                 formatted_logs.append([
-                    formatted_time,
+                    LogFormatter.format_timestamp(log['timestamp']),
                     log['function_name'],
                     log['prompt_tokens'],
                     log['completion_tokens'],
@@ -58,6 +70,33 @@ class LogFormatter:
             logger.error(f"Missing required field in log entry: {e}")
             return []
     
+    @staticmethod
+    def format_as_dataframe(logs: List[Dict[str, Any]]) -> pd.DataFrame:
+        """
+        Formats log entries as a DataFrame for the usage table.
+        
+        Token columns are int64 and cost is float64, so the table is
+        serialized as typed columns instead of per-cell Python objects.
+        
+        Args:
+            logs: List of log dictionaries
+            
+        Returns:
+            DataFrame with one column per entry in LOG_TABLE_HEADERS
+        """
+        try:
+            return pd.DataFrame({
+                "Time": [LogFormatter.format_timestamp(log['timestamp']) for log in logs],
+                "Function": [log['function_name'] for log in logs],
+                "Prompt Tokens": pd.Series([log['prompt_tokens'] for log in logs], dtype="int64"),
+                "Completion Tokens": pd.Series([log['completion_tokens'] for log in logs], dtype="int64"),
+                "Total Tokens": pd.Series([log['total_tokens'] for log in logs], dtype="int64"),
+                "Cost ($)": pd.Series([log['cost'] for log in logs], dtype="float64").round(4),
+            }, columns=LOG_TABLE_HEADERS)
+        except KeyError as e:
+            logger.error(f"Missing required field in log entry: {e}")
+            return pd.DataFrame(columns=LOG_TABLE_HEADERS)
+    
     @staticmethod
     def format_for_database(log_entry: Dict[str, Any]) -> LogEntry:
         """
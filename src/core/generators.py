@@ -2,14 +2,19 @@ from langchain_openai import ChatOpenAI
 import re
 from ..config.config import config
 from langchain_community.callbacks.manager import get_openai_callback
+from langchain_community.callbacks.openai_info import get_openai_token_cost_for_model
 from datetime import datetime
 from ..utils.singletons import OpenAIClient, DatabaseInstance
+from .llm_cache import response_cache
+from .formatters import LogFormatter
+from ..database.log_buffer import LogBuffer
 from typing import List, Dict, Any, Optional, Tuple, Callable, Union
 from ..utils.logger import get_logger
 import time
-from functools import wraps
+from functools import wraps, lru_cache
 import backoff
 import threading
+import inspect
 
 # Get logger instance
 logger = get_logger(__name__)
@@ -42,6 +47,8 @@ class TokenUsageTracker:
                 return
                 
             self.db = DatabaseInstance.get_instance()
+            # Log writes are batched by a background thread instead of blocking callers
+            self._log_buffer = LogBuffer(self._write_logs)
             self._initialized = True
     
     def _get_cache_key(self, method: str, *args, **kwargs) -> str:
@@ -69,19 +76,46 @@ class TokenUsageTracker:
     def add_log(self, function_name: str, prompt_tokens: int, 
                 completion_tokens: int, total_tokens: int, 
                 cost: float, output: Optional[str] = None) -> None:
-        """Add a log entry to the database."""
+        """Queue a log entry to be written to the database with the next batch.
+        
+        The entry is validated here, so invalid values raise to the caller
+        instead of failing the batch write later.
+        """
+        try:
+            self.db.validate_log_fields(function_name, prompt_tokens, completion_tokens,
+                                        total_tokens, cost, output)
+        except ValueError as e:
+            # Only log critical errors to file
+            logger.critical(f"Critical error in token tracking: {e}")
+            raise
+        self._log_buffer.put({
+            "function_name": function_name,
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": total_tokens,
+            "cost": cost,
+            "output": output,
+            "timestamp": datetime.now().timestamp()
+        })
+    
+    def _write_logs(self, entries: List[Dict[str, Any]]) -> None:
+        """Write a batch of queued log entries to the database."""
         try:
             with self._lock:  # Ensure thread-safe log addition
-                self.db.add_log(function_name, prompt_tokens, completion_tokens, 
-                              total_tokens, cost, output)
+                self.db.add_logs(entries)
                 # Invalidate relevant caches
                 with self._cache_lock:
                     self._cache.clear()  # Simple invalidation strategy
+            invalidate_functions_cache()
         except Exception as e:
             # Only log critical errors to file
             logger.critical(f"Critical error in token tracking: {e}")
             raise
     
+    def flush(self) -> None:
+        """Wait until every queued log entry has been written."""
+        self._log_buffer.flush()
+    
     def _clear_cache(self):
         """Clear all cached results."""
         with self._cache_lock:
@@ -105,6 +139,21 @@ class TokenUsageTracker:
             logger.critical(f"Critical error retrieving logs: {e}")
             raise
     
+    def get_usage_summary(self) -> Dict[str, Any]:
+        """Get aggregated token usage over all logs with caching."""
+        cache_key = self._get_cache_key("get_usage_summary")
+        cached_result = self._get_cached_result(cache_key)
+        if cached_result is not None:
+            return cached_result
+            
+        try:
+            result = self.db.get_usage_summary()
+            self._cache_result(cache_key, result)
+            return result
+        except Exception as e:
+            logger.critical(f"Critical error retrieving usage summary: {e}")
+            raise
+    
     def get_logs_by_date_range(self, start_date: str, end_date: str, 
                               limit: int = 100) -> List[Dict[str, Any]]:
         """Get logs from database filtered by date range with caching."""
@@ -278,28 +327,98 @@ class ContentFilterError(APIError):
 )
 @rate_limit
 def make_api_call(func):
-    """Decorator to handle API calls with rate limiting and error handling."""
+    """Decorator to handle API calls with rate limiting and error handling.
+    
+    Coroutine functions get an async wrapper, so awaiting the LLM does not
+    tie up a worker thread while token usage is still logged per call.
+    """
+    def record_usage(cb):
+        # Log token usage
+        logger.info(f"API call completed - Tokens: {cb.total_tokens}, Cost: ${cb.total_cost}")
+        # Add to token tracker
+        token_tracker.add_log(
+            function_name=func.__name__,
+            prompt_tokens=cb.prompt_tokens,
+            completion_tokens=cb.completion_tokens,
+            total_tokens=cb.total_tokens,
+            cost=cb.total_cost
+        )
+    
+    if inspect.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            try:
+                with get_openai_callback() as cb:
+                    result = await func(*args, **kwargs)
+                    # Only queues the log, so it does not block the event loop
+                    record_usage(cb)
+                    return result
+            except Exception as e:
+                logger.error(f"API call failed in {func.__name__}: {str(e)}")
+                raise
+        return async_wrapper
+    
     @wraps(func)
     def wrapper(*args, **kwargs):
         try:
             with get_openai_callback() as cb:
                 result = func(*args, **kwargs)
-                # Log token usage
-                logger.info(f"API call completed - Tokens: {cb.total_tokens}, Cost: ${cb.total_cost}")
-                # Add to token tracker
-                token_tracker.add_log(
-                    function_name=func.__name__,
-                    prompt_tokens=cb.prompt_tokens,
-                    completion_tokens=cb.completion_tokens,
-                    total_tokens=cb.total_tokens,
-                    cost=cb.total_cost
-                )
+                record_usage(cb)
                 return result
         except Exception as e:
             logger.error(f"API call failed in {func.__name__}: {str(e)}")
             raise
     return wrapper
 
+async def stream_llm(function_name: str, prompt: str):
+    """Stream a completion and log its token usage once it finishes.
+    
+    Responses are cached on the exact prompt, so repeating a request returns
+    the stored text at once without calling the model or logging usage.
+    
+    Args:
+        function_name: Name the usage is logged under
+        prompt: Prompt sent to the model
+        
+    Yields:
+        The text generated so far, after every chunk
+    """
+    cache_key = response_cache.make_key(function_name, llm.model_name, prompt)
+    cached_response = response_cache.get(cache_key)
+    if cached_response is not None:
+        logger.info(f"Returning cached response for {function_name}")
+        yield cached_response
+        return
+    
+    message = None
+    async for chunk in llm.astream([("human", prompt)]):
+        message = chunk if message is None else message + chunk
+        yield message.content
+    if message is not None and message.content:
+        response_cache.set(cache_key, message.content)
+    
+    # Streamed responses carry usage on the aggregated message instead of the callback
+    usage = getattr(message, "usage_metadata", None) or {}
+    prompt_tokens = usage.get("input_tokens", 0)
+    completion_tokens = usage.get("output_tokens", 0)
+    try:
+        cost = (
+            get_openai_token_cost_for_model(llm.model_name, prompt_tokens)
+            + get_openai_token_cost_for_model(llm.model_name, completion_tokens, is_completion=True)
+        )
+    except ValueError:
+        logger.warning(f"Unknown model {llm.model_name}, logging {function_name} without cost")
+        cost = 0.0
+    logger.info(f"API call completed - Tokens: {prompt_tokens + completion_tokens}, Cost: ${cost}")
+    # Only queues the log, so it does not block the event loop
+    token_tracker.add_log(
+        function_name=function_name,
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        total_tokens=prompt_tokens + completion_tokens,
+        cost=cost
+    )
+
 def fix_markdown_formatting(text: str) -> str:
     """Fix common markdown formatting issues."""
     # Remove extra newlines
@@ -331,50 +450,6 @@ def fix_markdown_formatting(text: str) -> str:
     
     return text.strip()
 
-class LogFormatter:
-    """Utility class for formatting log data."""
-    
-    @staticmethod
-    def calculate_totals(logs: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Calculate total tokens and cost from logs."""
-        total_tokens = sum(log['total_tokens'] for log in logs)
-        total_cost = sum(log['cost'] for log in logs)
-        return {
-            'total_tokens': total_tokens,
-            'total_cost': total_cost
-        }
-    
-    @staticmethod
-    def format_log_entry(log: Dict[str, Any]) -> str:
-        """Format a single log entry as a string."""
-        return (
-            f"Function: {log['function_name']}\n"
-            f"Tokens: {log['total_tokens']}\n"
-            f"Cost: ${log['cost']:.4f}\n"
-            f"Timestamp: {log['timestamp']}"
-        )
-    
-    @staticmethod
-    def format_logs_as_table(logs: List[Dict[str, Any]]) -> str:
-        """Format logs as a markdown table."""
-        if not logs:
-            return "No logs found."
-        
-        # Create table header
-        table = "| Function | Tokens | Cost | Timestamp |\n"
-        table += "|----------|--------|------|-----------|\n"
-        
-        # Add rows
-        for log in logs:
-            table += (
-                f"| {log['function_name']} | "
-                f"{log['total_tokens']} | "
-                f"${log['cost']:.4f} | "
-                f"{log['timestamp']} |\n"
-            )
-        
-        return table
-
 def construct_instruction_prompt():
     """Constructs the system instruction message for the LLM."""
     return ("""
@@ -442,7 +517,7 @@ def construct_input_prompt(prompt, theme, subject, complexity, audience, style,
     # Get template structure if selected
     structure = ""
     if template_name and template_name != "Custom":
-        template = config.get_templates().get(template_name)
+        template = config.get_template(template_name)
         if template:
             structure = template["structure"]
     
@@ -467,11 +542,11 @@ def construct_input_prompt(prompt, theme, subject, complexity, audience, style,
     """
 
 @make_api_call
-def generate_cheatsheet(prompt, theme, subject, template_name, style, exemplified, complexity, audience, enforce_formatting):
+async def generate_cheatsheet(prompt, theme, subject, template_name, style, exemplified, complexity, audience, enforce_formatting):
     """Generate a cheatsheet based on the given parameters."""
     try:
         # Get template from config
-        template = config.get_instance().get_templates().get(template_name, {})
+        template = config.get_template(template_name) or {}
         
         # Construct the full prompt
         full_prompt = f"""Create a cheatsheet about {subject} with the following parameters:
@@ -490,7 +565,7 @@ def generate_cheatsheet(prompt, theme, subject, template_name, style, exemplifie
         Format the output in markdown."""
         
         # Make the API call
-        response = llm.invoke([("human", full_prompt)])
+        response = await llm.ainvoke([("human", full_prompt)])
         
         # Format the response if requested
         if enforce_formatting:
@@ -504,7 +579,7 @@ def generate_cheatsheet(prompt, theme, subject, template_name, style, exemplifie
         error_message = f"Error generating cheatsheet: {str(e)}"
         return error_message, error_message
 
-def summarize_content_for_features(content):
+async def summarize_content_for_features(content):
     """Creates a concise summary of the cheatsheet content for use in other features.
     This helps reduce token usage when generating quizzes, flashcards, etc."""
     summary_prompt = f"""
@@ -525,12 +600,11 @@ def summarize_content_for_features(content):
     """
     
     llm = OpenAIClient.get_instance()
-    response = llm.invoke([("human", summary_prompt)])
+    response = await llm.ainvoke([("human", summary_prompt)])
     return response.content
 
-@make_api_call
-def generate_quiz(content, quiz_type, difficulty, count):
-    """Generate a quiz based on the content."""
+async def generate_quiz(content, quiz_type, difficulty, count):
+    """Stream a quiz based on the content."""
     try:
         # Validate quiz type and difficulty
         valid_types = ["multiple_choice", "true_false", "short_answer"]
@@ -563,16 +637,17 @@ def generate_quiz(content, quiz_type, difficulty, count):
         For true/false, just state True or False.
         For short answer, provide a brief expected answer."""
         
-        # Make the API call
-        response = llm.invoke([("human", prompt)])
-        return fix_markdown_formatting(response.content)
+        # Stream the response, then yield the formatted result
+        text = ""
+        async for text in stream_llm("generate_quiz", prompt):
+            yield text
+        yield fix_markdown_formatting(text)
     except Exception as e:
         logger.error(f"Error in generate_quiz: {str(e)}")
-        return f"Error generating quiz: {str(e)}"
+        yield f"Error generating quiz: {str(e)}"
 
-@make_api_call
-def generate_flashcards(content, count):
-    """Generate flashcards based on the content."""
+async def generate_flashcards(content, count):
+    """Stream flashcards based on the content."""
     try:
         # Validate input
         if count < 1 or count > 20:
@@ -589,16 +664,17 @@ def generate_flashcards(content, count):
         
         Make the flashcards concise and focused on key concepts."""
         
-        # Make the API call
-        response = llm.invoke([("human", prompt)])
-        return fix_markdown_formatting(response.content)
+        # Stream the response, then yield the formatted result
+        text = ""
+        async for text in stream_llm("generate_flashcards", prompt):
+            yield text
+        yield fix_markdown_formatting(text)
     except Exception as e:
         logger.error(f"Error in generate_flashcards: {str(e)}")
-        return f"Error generating flashcards: {str(e)}"
+        yield f"Error generating flashcards: {str(e)}"
 
-@make_api_call
-def generate_practice_problems(content, problem_type, count):
-    """Generate practice problems based on the content."""
+async def generate_practice_problems(content, problem_type, count):
+    """Stream practice problems based on the content."""
     try:
         # Validate problem type
         valid_types = ["coding", "math", "concept", "exercises"]
@@ -623,16 +699,17 @@ def generate_practice_problems(content, problem_type, count):
         
         Make the problems challenging but solvable."""
         
-        # Make the API call
-        response = llm.invoke([("human", prompt)])
-        return fix_markdown_formatting(response.content)
+        # Stream the response, then yield the formatted result
+        text = ""
+        async for text in stream_llm("generate_practice_problems", prompt):
+            yield text
+        yield fix_markdown_formatting(text)
     except Exception as e:
         logger.error(f"Error in generate_practice_problems: {str(e)}")
-        return f"Error generating practice problems: {str(e)}"
+        yield f"Error generating practice problems: {str(e)}"
 
-@make_api_call
-def generate_summary(content, level, focus):
-    """Generate a summary based on the content."""
+async def generate_summary(content, level, focus):
+    """Stream a summary based on the content."""
     try:
         # Validate summary level and focus
         valid_levels = ["brief", "detailed", "comprehensive"]
@@ -650,18 +727,24 @@ def generate_summary(content, level, focus):
         
         Format the summary in markdown with appropriate headings and sections."""
         
-        # Make the API call
-        response = llm.invoke([("human", prompt)])
-        return fix_markdown_formatting(response.content)
+        # Stream the response, then yield the formatted result
+        text = ""
+        async for text in stream_llm("generate_summary", prompt):
+            yield text
+        yield fix_markdown_formatting(text)
     except Exception as e:
         logger.error(f"Error in generate_summary: {str(e)}")
-        return f"Error generating summary: {str(e)}"
+        yield f"Error generating summary: {str(e)}"
 
 # Log-related functions that use the token tracker
 def get_token_logs(limit: int = 100) -> List[Dict[str, Any]]:
     """Get logs from database."""
     return token_tracker.get_logs(limit)
 
+def get_token_usage_summary() -> Dict[str, Any]:
+    """Get token usage totals and usage by function over all logs."""
+    return token_tracker.get_usage_summary()
+
 def get_token_logs_by_date_range(start_date: str, end_date: str, limit: int = 100) -> List[Dict[str, Any]]:
     """Get logs from database filtered by date range."""
     return token_tracker.get_logs_by_date_range(start_date, end_date, limit)
@@ -682,6 +765,25 @@ def get_unique_functions() -> List[str]:
     """Get list of unique function names from database."""
     return token_tracker.get_unique_functions()
 
+# Monotonic counter bumped whenever a new token usage row is written
+_logs_version = 0
+_logs_version_lock = threading.Lock()
+
+def invalidate_functions_cache() -> None:
+    """Invalidate the cached unique function names after a log write."""
+    global _logs_version
+    with _logs_version_lock:
+        _logs_version += 1
+
+@lru_cache(maxsize=1)
+def _get_unique_functions_for_version(version: int) -> Tuple[str, ...]:
+    """Fetch unique function names for a given logs version."""
+    return tuple(get_unique_functions())
+
+def get_unique_functions_cached() -> List[str]:
+    """Get unique function names, only hitting the database after new logs are written."""
+    return list(_get_unique_functions_for_version(_logs_version))
+
 def calculate_total_usage() -> Dict[str, Any]:
     """Calculate total token usage and cost."""
     logs = get_token_logs()
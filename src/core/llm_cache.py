@@ -0,0 +1,64 @@
+from collections import OrderedDict
+from hashlib import blake2b
+from typing import Optional, Tuple
+from ..utils.logger import get_logger
+import threading
+import time
+
+# Get logger instance
+logger = get_logger(__name__)
+
+# Cache limits for generated responses
+RESPONSE_CACHE_SIZE = 256
+RESPONSE_CACHE_TTL_SECONDS = 3600  # 1 hour
+
+class ResponseCache:
+    """Thread-safe LRU cache of LLM responses keyed on the exact prompt.
+
+    Repeating a request with identical content and parameters returns the
+    stored response instead of calling the model again.
+    """
+
+    def __init__(self, max_size: int = RESPONSE_CACHE_SIZE, ttl: float = RESPONSE_CACHE_TTL_SECONDS):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(function_name: str, model_name: str, prompt: str) -> str:
+        """Build the cache key for a prompt sent by a function to a model."""
+        digest = blake2b(digest_size=16)
+        for part in (function_name, model_name, prompt):
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached response if it exists and is not expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, response = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return response
+
+    def set(self, key: str, response: str) -> None:
+        """Store a response, evicting the least recently used one when full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        with self._lock:
+            self._entries.clear()
+
+# Create global response cache instance
+response_cache = ResponseCache()
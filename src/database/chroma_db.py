@@ -1,5 +1,5 @@
 import os
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set, Iterator
 import chromadb
 from chromadb.config import Settings
 from datetime import datetime
@@ -13,6 +13,9 @@ from ..utils.utils import validate_numeric_range, validate_positive_integer
 # Get logger instance
 logger = get_logger(__name__)
 
+# Number of logs fetched per query when iterating over large result sets
+LOG_BATCH_SIZE = 1000
+
 def handle_chroma_errors(func):
     """Decorator to handle ChromaDB errors with retries."""
     @wraps(func)
@@ -277,18 +280,8 @@ class ChromaDatabase:
         """
         try:
             # Validate input parameters
-            if not isinstance(function_name, str) or not function_name.strip():
-                raise ValueError("Invalid function name")
-            if not isinstance(prompt_tokens, int) or prompt_tokens < 0:
-                raise ValueError("prompt_tokens must be a non-negative integer")
-            if not isinstance(completion_tokens, int) or completion_tokens < 0:
-                raise ValueError("completion_tokens must be a non-negative integer")
-            if not isinstance(total_tokens, int) or total_tokens < 0:
-                raise ValueError("total_tokens must be a non-negative integer")
-            if not isinstance(cost, (int, float)) or cost < 0:
-                raise ValueError("cost must be a non-negative number")
-            if output is not None and not isinstance(output, str):
-                raise ValueError("output must be a string or None")
+            self.validate_log_fields(function_name, prompt_tokens, completion_tokens,
+                                     total_tokens, cost, output)
             
             # Create a unique ID for the log entry
             timestamp = datetime.now().timestamp()
@@ -317,6 +310,64 @@ class ChromaDatabase:
             logger.error(f"Error adding log entry: {e}")
             raise
     
+    @staticmethod
+    def validate_log_fields(function_name: str, prompt_tokens: int, completion_tokens: int,
+                            total_tokens: int, cost: float, output: Optional[str]) -> None:
+        """Validate the fields of a log entry, raising ValueError when one is invalid."""
+        if not isinstance(function_name, str) or not function_name.strip():
+            raise ValueError("Invalid function name")
+        if not isinstance(prompt_tokens, int) or prompt_tokens < 0:
+            raise ValueError("prompt_tokens must be a non-negative integer")
+        if not isinstance(completion_tokens, int) or completion_tokens < 0:
+            raise ValueError("completion_tokens must be a non-negative integer")
+        if not isinstance(total_tokens, int) or total_tokens < 0:
+            raise ValueError("total_tokens must be a non-negative integer")
+        if not isinstance(cost, (int, float)) or cost < 0:
+            raise ValueError("cost must be a non-negative number")
+        if output is not None and not isinstance(output, str):
+            raise ValueError("output must be a string or None")
+    
+    @handle_chroma_errors
+    def add_logs(self, entries: List[Dict[str, Any]]) -> None:
+        """Add several log entries to the database in a single write.
+        
+        Invalid entries are logged and skipped so they do not fail the rest of the batch.
+        
+        Args:
+            entries: Dictionaries with function_name, prompt_tokens, completion_tokens,
+                total_tokens, cost and timestamp keys, and an optional output
+        """
+        if not entries:
+            return
+        
+        ids, metadatas, documents = [], [], []
+        for entry in entries:
+            try:
+                self.validate_log_fields(entry['function_name'], entry['prompt_tokens'],
+                                         entry['completion_tokens'], entry['total_tokens'],
+                                         entry['cost'], entry.get('output'))
+            except (KeyError, ValueError) as e:
+                logger.error(f"Skipping invalid log entry: {e}")
+                continue
+            # Entries keep the time they were logged, not the time they are written
+            ids.append(f"{entry['function_name']}_{entry['timestamp']}")
+            metadatas.append({
+                "timestamp": entry['timestamp'],
+                "function_name": entry['function_name'],
+                "prompt_tokens": entry['prompt_tokens'],
+                "completion_tokens": entry['completion_tokens'],
+                "total_tokens": entry['total_tokens'],
+                "cost": entry['cost']
+            })
+            documents.append(entry.get('output') or "")
+        
+        if not ids:
+            return
+        
+        collection = self._get_thread_safe_collection()
+        collection.add(ids=ids, metadatas=metadatas, documents=documents)
+        logger.debug(f"Added {len(ids)} log entries")
+    
     @handle_chroma_errors
     def get_logs_by_date_range(self, start_date: str, end_date: str, 
                               limit: int = 100) -> List[Dict[str, Any]]:
@@ -467,6 +518,40 @@ class ChromaDatabase:
             logger.error(f"Error getting logs: {e}")
             raise
 
+    @handle_chroma_errors
+    def get_usage_summary(self, where: Optional[Dict[str, Any]] = None,
+                          limit: Optional[int] = None) -> Dict[str, Any]:
+        """Aggregate token usage from log metadata without loading log outputs.
+        
+        Args:
+            where: Optional ChromaDB where clause to restrict the logs
+            limit: Optional maximum number of logs to aggregate
+            
+        Returns:
+            Dict[str, Any]: total_tokens, total_cost, total_calls and a by_function
+                mapping of function name to its total_tokens and total_cost
+        """
+        collection = self._get_thread_safe_collection()
+        results = collection.get(where=where or None, limit=limit, include=["metadatas"])
+        
+        summary = {
+            'total_tokens': 0,
+            'total_cost': 0.0,
+            'total_calls': 0,
+            'by_function': {}
+        }
+        for metadata in results.get('metadatas') or []:
+            function_usage = summary['by_function'].setdefault(
+                metadata['function_name'], {'total_tokens': 0, 'total_cost': 0.0}
+            )
+            function_usage['total_tokens'] += metadata['total_tokens']
+            function_usage['total_cost'] += metadata['cost']
+            summary['total_tokens'] += metadata['total_tokens']
+            summary['total_cost'] += metadata['cost']
+            summary['total_calls'] += 1
+        
+        return summary
+
     @handle_chroma_errors
     def get_logs_by_cost_range(self, min_cost: float, max_cost: float, 
                               limit: int = 100) -> List[Dict[str, Any]]:
@@ -494,12 +579,18 @@ class ChromaDatabase:
             raise
 
     @handle_chroma_errors
-    def query_logs(self, query_builder_or_dict, limit: int = 100) -> List[Dict[str, Any]]:
+    def query_logs(self, query_builder_or_dict, limit: int = 100,
+                   include_output: bool = False, offset: int = 0) -> List[Dict[str, Any]]:
         """Execute a combined query using the query builder.
         
+        All filters are evaluated by ChromaDB through the where clause, and the
+        stored output documents are only fetched when explicitly requested.
+        
         Args:
             query_builder_or_dict: An instance of LogQueryBuilder or a dictionary containing the query conditions
             limit: Maximum number of results to return
+            include_output: Whether to also fetch the stored output text of each log
+            offset: Number of matching logs to skip, for paging through results
             
         Returns:
             List of log entries matching the query conditions
@@ -509,7 +600,7 @@ class ChromaDatabase:
         # Handle both LogQueryBuilder object and dictionary
         if hasattr(query_builder_or_dict, 'has_filters') and callable(getattr(query_builder_or_dict, 'has_filters')):
             # If no filters are set, return all logs up to the limit
-            if not query_builder_or_dict.has_filters():
+            if not query_builder_or_dict.has_filters() and not offset:
                 logger.debug("No filters set, returning all logs")
                 return self.get_logs(limit)
             
@@ -524,14 +615,39 @@ class ChromaDatabase:
         
         logger.debug(f"Executing query with where clause: {where_clause}")
         
-        # Execute the query
+        # Execute the query, skipping the output documents unless needed
         results = collection.get(
-            where=where_clause,
-            limit=limit
+            where=where_clause or None,
+            limit=limit,
+            offset=offset or None,
+            include=["metadatas", "documents"] if include_output else ["metadatas"]
         )
         
         return self._format_results(results)
 
+    def iter_logs(self, where: Optional[Dict[str, Any]] = None, limit: Optional[int] = None,
+                  batch_size: int = LOG_BATCH_SIZE) -> Iterator[List[Dict[str, Any]]]:
+        """Yield the logs matching a where clause in batches.
+        
+        Args:
+            where: Optional ChromaDB where clause to restrict the logs
+            limit: Maximum number of logs to yield, or None for every match
+            batch_size: Number of logs fetched per query
+            
+        Yields:
+            List[Dict[str, Any]]: The next batch of log entries
+        """
+        offset = 0
+        while limit is None or offset < limit:
+            size = batch_size if limit is None else min(batch_size, limit - offset)
+            batch = self.query_logs({"where": where or {}, "limit": size}, offset=offset)
+            if not batch:
+                return
+            yield batch
+            offset += len(batch)
+            if len(batch) < size:
+                return
+
     def _format_results(self, results: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Format the results from ChromaDB into a list of dictionaries."""
         if not results or not results.get('ids'):
@@ -605,6 +721,45 @@ class ChromaDatabase:
         
         return template_id
 
+    @handle_chroma_errors
+    def add_templates(self, templates: List[Dict[str, str]]) -> List[str]:
+        """Add several templates to the database in a single write.
+        
+        Args:
+            templates: Dictionaries with name, type and structure keys
+            
+        Returns:
+            List[str]: IDs of the added templates
+        """
+        if not templates:
+            return []
+        
+        # Generate unique IDs sharing one timestamp
+        timestamp = datetime.now().timestamp()
+        template_ids = [f"template_{timestamp}_{i}" for i in range(len(templates))]
+        
+        # Prepare metadata with ISO format timestamps
+        now = datetime.now().isoformat()
+        metadatas = [
+            {
+                "name": template["name"],
+                "type": template["type"],
+                "created_at": now,
+                "updated_at": now
+            }
+            for template in templates
+        ]
+        
+        # Add to collection
+        collection = self._get_templates_collection()
+        collection.add(
+            ids=template_ids,
+            metadatas=metadatas,
+            documents=[template["structure"] for template in templates]
+        )
+        
+        return template_ids
+
     @handle_chroma_errors
     def get_template(self, template_id: str) -> Dict[str, Any]:
         """Get a template by ID."""
@@ -623,6 +778,31 @@ class ChromaDatabase:
             "updated_at": result['metadatas'][0]['updated_at']
         }
 
+    @handle_chroma_errors
+    def get_template_by_name(self, name: str) -> Optional[Dict[str, Any]]:
+        """Get a template by name.
+        
+        Args:
+            name: Template name
+            
+        Returns:
+            Optional[Dict[str, Any]]: Template data or None if not found
+        """
+        collection = self._get_templates_collection()
+        result = collection.get(where={"name": name}, limit=1)
+        
+        if not result or not result['ids']:
+            return None
+            
+        return {
+            "id": result['ids'][0],
+            "name": result['metadatas'][0]['name'],
+            "type": result['metadatas'][0]['type'],
+            "structure": result['documents'][0],
+            "created_at": result['metadatas'][0]['created_at'],
+            "updated_at": result['metadatas'][0]['updated_at']
+        }
+
     @handle_chroma_errors
     def get_all_templates(self) -> List[Dict[str, Any]]:
         """Get all templates with improved error handling."""
@@ -663,6 +843,19 @@ class ChromaDatabase:
             logger.error(f"Error in get_all_templates: {e}")
             return []
 
+    @handle_chroma_errors
+    def get_template_names(self) -> Set[str]:
+        """Get the names of all templates without loading their content.
+        
+        Returns:
+            Set[str]: Template names
+        """
+        collection = self._get_templates_collection()
+        results = collection.get(include=["metadatas"])
+        if not results or not results.get('metadatas'):
+            return set()
+        return {metadata['name'] for metadata in results['metadatas'] if metadata and 'name' in metadata}
+
     @handle_chroma_errors
     def delete_template(self, template_id: str) -> bool:
         """Delete a template."""
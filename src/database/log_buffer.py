@@ -0,0 +1,65 @@
+from typing import List, Dict, Any, Callable
+from ..utils.logger import get_logger
+import atexit
+import queue
+import threading
+import time
+
+# Get logger instance
+logger = get_logger(__name__)
+
+# Flush when this many entries are waiting, or after the interval otherwise
+LOG_BUFFER_BATCH_SIZE = 50
+LOG_BUFFER_FLUSH_INTERVAL_SECONDS = 0.2
+
+class LogBuffer:
+    """Buffers log entries in memory and writes them in batches from a background thread.
+
+    Callers only enqueue entries, so they never wait on a database write.
+    The write callable receives each batch in the order it was logged.
+    """
+
+    def __init__(self, write_batch: Callable[[List[Dict[str, Any]]], None],
+                 batch_size: int = LOG_BUFFER_BATCH_SIZE,
+                 flush_interval: float = LOG_BUFFER_FLUSH_INTERVAL_SECONDS):
+        self._write_batch = write_batch
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        self._worker = threading.Thread(target=self._run, name="log-buffer", daemon=True)
+        self._worker.start()
+        # Write whatever is still queued when the process exits
+        atexit.register(self.flush)
+
+    def put(self, entry: Dict[str, Any]) -> None:
+        """Queue a log entry to be written with the next batch."""
+        self._queue.put(entry)
+
+    def _write(self, batch: List[Dict[str, Any]]) -> None:
+        """Write a batch, logging failures so the worker keeps running."""
+        try:
+            self._write_batch(batch)
+        except Exception as e:
+            logger.critical(f"Failed to write {len(batch)} buffered log entries: {e}")
+        finally:
+            for _ in batch:
+                self._queue.task_done()
+
+    def _run(self) -> None:
+        """Worker loop: collect entries for up to one interval and write them as a batch."""
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._write(batch)
+
+    def flush(self) -> None:
+        """Block until every queued entry has been written."""
+        self._queue.join()
@@ -1,34 +1,11 @@
 from typing import List, Optional, Tuple, Any, Dict
 from datetime import datetime, timedelta
-import re
 from ..utils.logger import get_logger
-import backoff
-from functools import wraps
-from ..utils.utils import validate_date_format, validate_numeric_range, validate_positive_integer
+from ..utils.utils import ISO_DATE_PATTERN, validate_date_format, validate_numeric_range, validate_positive_integer
 
 # Get logger instance
 logger = get_logger(__name__)
 
-def handle_query_errors(func):
-    """Decorator to handle query builder errors with retries."""
-    @wraps(func)
-    @backoff.on_exception(
-        backoff.expo,
-        (QueryBuilderError, Exception),
-        max_tries=3,
-        max_time=30
-    )
-    def wrapper(*args, **kwargs):
-        try:
-            return func(*args, **kwargs)
-        except QueryBuilderError as e:
-            logger.error(f"Query builder error in {func.__name__}: {str(e)}")
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error in {func.__name__}: {str(e)}")
-            raise QueryBuilderError(f"Unexpected error: {str(e)}")
-    return wrapper
-
 class QueryBuilderError(Exception):
     """Base exception class for query builder errors."""
     pass
@@ -49,7 +26,6 @@ class LogQueryBuilder:
     def __init__(self):
         self.conditions: List[Dict[str, Any]] = []
     
-    @handle_query_errors
     def _validate_date(self, date_str: str) -> bool:
         """
         Validate date string format.
@@ -67,7 +43,6 @@ class LogQueryBuilder:
             raise InvalidDateError(f"Invalid date format: {date_str}. Expected YYYY-MM-DD format")
         return True
     
-    @handle_query_errors
     def _validate_numeric_range(self, min_val: float, max_val: float) -> bool:
         """
         Validate numeric range.
@@ -86,7 +61,22 @@ class LogQueryBuilder:
             raise InvalidRangeError(f"Invalid range: min ({min_val}) must be less than or equal to max ({max_val})")
         return True
     
-    @handle_query_errors
+    @staticmethod
+    def _parse_day(date_str: str) -> datetime:
+        """
+        Parse a YYYY-MM-DD date without a time or timezone.
+        
+        Zero-padded dates are matched with a precompiled regex; anything else
+        goes through strptime, which also accepts non-padded months and days.
+        
+        Raises:
+            ValueError: If the string is not a valid YYYY-MM-DD date
+        """
+        match = ISO_DATE_PATTERN.fullmatch(date_str)
+        if match:
+            return datetime(int(match[1]), int(match[2]), int(match[3]))
+        return datetime.strptime(date_str, "%Y-%m-%d")
+    
     def add_date_range(self, start_date: str, end_date: str) -> 'LogQueryBuilder':
         """Add date range filter to the query.
         
@@ -99,8 +89,8 @@ class LogQueryBuilder:
         """
         try:
             # Validate dates
-            start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-            end_dt = datetime.strptime(end_date, "%Y-%m-%d")
+            start_dt = self._parse_day(start_date)
+            end_dt = self._parse_day(end_date)
             
             if start_dt > end_dt:
                 raise ValueError("Start date must be before end date")
@@ -115,14 +105,12 @@ class LogQueryBuilder:
             end_dt = end_dt.replace(hour=23, minute=59, second=59, microsecond=999999)
             
             # Add conditions directly without nesting $and
-            self.conditions.append({"timestamp": {"$gte": start_dt.timestamp()}})
-            self.conditions.append({"timestamp": {"$lte": end_dt.timestamp()}})
+            self.conditions += ({"timestamp": {"$gte": start_dt.timestamp()}}, {"timestamp": {"$lte": end_dt.timestamp()}})
             
             return self
         except ValueError as e:
             raise InvalidDateError(f"Invalid date format: {str(e)}")
     
-    @handle_query_errors
     def add_function_filter(self, function_name: str) -> 'LogQueryBuilder':
         """Add function name filter to the query.
         
@@ -142,7 +130,6 @@ class LogQueryBuilder:
         self.conditions.append({"function_name": cleaned_name})
         return self
     
-    @handle_query_errors
     def add_token_range(self, min_tokens: int, max_tokens: int) -> 'LogQueryBuilder':
         """Add token range filter to the query.
         
@@ -160,11 +147,9 @@ class LogQueryBuilder:
             raise InvalidRangeError("Minimum tokens must be less than or equal to maximum tokens")
             
         # Add conditions directly without nesting $and
-        self.conditions.append({"total_tokens": {"$gte": min_tokens}})
-        self.conditions.append({"total_tokens": {"$lte": max_tokens}})
+        self.conditions += ({"total_tokens": {"$gte": min_tokens}}, {"total_tokens": {"$lte": max_tokens}})
         return self
     
-    @handle_query_errors
     def add_cost_range(self, min_cost: float, max_cost: float) -> 'LogQueryBuilder':
         """Add cost range filter to the query.
         
@@ -182,11 +167,9 @@ class LogQueryBuilder:
             raise InvalidRangeError("Minimum cost must be less than or equal to maximum cost")
             
         # Add conditions directly without nesting $and
-        self.conditions.append({"cost": {"$gte": min_cost}})
-        self.conditions.append({"cost": {"$lte": max_cost}})
+        self.conditions += ({"cost": {"$gte": min_cost}}, {"cost": {"$lte": max_cost}})
         return self
     
-    @handle_query_errors
     def has_filters(self) -> bool:
         """
         Check if any filters are set.
@@ -196,7 +179,6 @@ class LogQueryBuilder:
         """
         return bool(self.conditions)
     
-    @handle_query_errors
     def set_limit(self, limit: int) -> 'LogQueryBuilder':
         """Set the limit for the number of results.
         
@@ -223,7 +205,6 @@ class LogQueryBuilder:
             query['$limit'] = self.limit
         return query
     
-    @handle_query_errors
     def build(self) -> Dict[str, Any]:
         """Build the final query dictionary."""
         if not self.conditions:
@@ -2,6 +2,18 @@ from dotenv import load_dotenv
 import gradio as gr
 import os
 import sys
+import asyncio
+import atexit
+import csv
+import json
+import shutil
+import tempfile
+import threading
+import time
+import numpy as np
+import pandas as pd
+from collections import OrderedDict
+from functools import lru_cache, wraps
 
 # Add the parent directory to sys.path to allow imports to work
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -10,29 +22,13 @@ if parent_dir not in sys.path:
     sys.path.append(parent_dir)
 
 from src.config.config import config
-from src.core.generators import (
-    generate_cheatsheet,
-    generate_quiz,
-    generate_flashcards,
-    generate_practice_problems,
-    generate_summary,
-    summarize_content_for_features,
-    get_token_logs,
-    calculate_total_usage,
-    get_token_logs_by_date_range,
-    get_token_logs_by_function,
-    get_token_logs_by_token_range,
-    get_token_logs_by_cost_range,
-    get_unique_functions,
-    calculate_total_usage_by_function,
-    calculate_total_usage_by_date
-)
-from src.utils.utils import validate_date_format
-from src.utils.singletons import OpenAIClient, DatabaseInstance
+from src.utils.utils import validate_date_format, minify_css
+from src.utils.singletons import DatabaseInstance
 from datetime import datetime, timedelta
 from src.utils.logger import get_logger
-from typing import Union, List, Any
+from typing import Union, List, Any, Optional
 from src.database.query_builder import LogQueryBuilder
+from src.core.formatters import LogFormatter, LOG_TABLE_HEADERS
 
 # Get logger instance
 logger = get_logger(__name__)
@@ -40,365 +36,120 @@ logger = get_logger(__name__)
 # Load environment variables
 load_dotenv()
 
-# Initialize OpenAI client and database
-llm = OpenAIClient.get_instance()
+# Initialize database
 db = DatabaseInstance.get_instance()
 
+def _generators():
+    """Import the generators module on first use.
+    
+    It pulls in LangChain and the OpenAI client, so deferring it keeps those
+    imports off the startup path. All LLM calls go through
+    OpenAIClient.get_instance() so they share one pooled HTTP client.
+    """
+    from src.core import generators
+    return generators
+
 # Constants
-EMPTY_STATS_TABLE = """
-| Metric | Value |
-|--------|-------|
-| Total Tokens | 0 |
-| Total Cost | $0.00 |
-| Avg Tokens/Call | 0 |
-| Avg Cost/Call | $0.00 |
-"""
+QUEUE_DEFAULT_CONCURRENCY_LIMIT = 8
+QUEUE_MAX_SIZE = 64
+# LLM events share one concurrency group so slow generations cannot crowd out the UI
+LLM_CONCURRENCY_LIMIT = 4
+LLM_CONCURRENCY_ID = "llm"
+STATS_TABLE_HEADERS = ["Metric", "Value"]
+EMPTY_STATS_TABLE = [
+    ["Total Tokens", "0"],
+    ["Total Cost", "$0.00"],
+    ["Avg Tokens/Call", "0"],
+    ["Avg Cost/Call", "$0.00"],
+]
+
+def format_stats_table(total_tokens: int, total_cost: float, total_calls: int) -> List[List[str]]:
+    """Format the overview statistics rows for the given totals.
+    
+    Args:
+        total_tokens: Total number of tokens
+        total_cost: Total cost in dollars
+        total_calls: Number of calls the averages are computed over
+        
+    Returns:
+        List[List[str]]: [metric, value] rows for the stats table
+    """
+    avg_tokens = total_tokens / total_calls if total_calls > 0 else 0
+    avg_cost = total_cost / total_calls if total_calls > 0 else 0
+    return [
+        ["Total Tokens", f"{total_tokens:,}"],
+        ["Total Cost", f"${total_cost:.4f}"],
+        ["Avg Tokens/Call", f"{avg_tokens:,.1f}"],
+        ["Avg Cost/Call", f"${avg_cost:.4f}"],
+    ]
+
+NO_USAGE_BY_FUNCTION = "No usage data available by function"
+
+# Usage summaries kept for page turns, keyed on the filter's where clause and limit
+FILTER_SUMMARY_CACHE_SIZE = 32
+
+# Output values shown after the filters are cleared
+CLEARED_FILTER_RESULTS = ([], "", EMPTY_STATS_TABLE, NO_USAGE_BY_FUNCTION)
+
+# Default filter inputs: start_date, end_date, function, min/max tokens,
+# min/max cost, result limit, page and page size
+CLEAR_FILTERS_DEFAULTS = ("", "", None, 0, 10000, 0, 1, 100, 0, 50)
+
+# Set once the default templates migration has finished
+_templates_migrated = threading.Event()
+TEMPLATE_MIGRATION_TIMEOUT_SECONDS = 30
+
+# Template cache shared by the template list and dropdowns, invalidated on writes
+# and refreshed after a TTL to pick up changes made outside this process
+TEMPLATES_CACHE_TTL_SECONDS = 5.0
+TEMPLATE_QUERY_CACHE_SIZE = 64
+_templates_cache = {"version": 0, "entries": {}, "loaded_at": 0.0}
+_templates_cache_lock = threading.Lock()
+
+def invalidate_templates_cache():
+    """Bump the template cache version so the next read goes to the database."""
+    with _templates_cache_lock:
+        _templates_cache["version"] += 1
+        _templates_cache["entries"].clear()
+
+def get_cached_templates() -> List[dict]:
+    """Get all templates, reading the database only when the cache is invalid or expired."""
+    with _templates_cache_lock:
+        version = _templates_cache["version"]
+        templates = _templates_cache["entries"].get("templates")
+        expired = time.monotonic() - _templates_cache["loaded_at"] > TEMPLATES_CACHE_TTL_SECONDS
+    if templates is not None and not expired:
+        return templates
+    
+    templates = db.get_all_templates()
+    with _templates_cache_lock:
+        # Skip caching if a write happened while we were reading
+        if _templates_cache["version"] == version:
+            # Entries derived from the previous list can never be served again, so drop them
+            _templates_cache["entries"] = {"templates": templates}
+            _templates_cache["loaded_at"] = time.monotonic()
+    return templates
 
 def migrate_default_templates():
     """Migrate default templates to database if they don't exist."""
     try:
-        # Define comprehensive default templates
-        default_templates = {
-            "Study Guide": {
-                "type": "study",
-                "content": """# {subject} Study Guide
-
-## Overview
-{Comprehensive introduction to the topic, including its importance and relevance}
-
-## Key Concepts
-{Detailed explanation of fundamental concepts and theories, with clear definitions}
-
-## Core Principles
-{Main principles and foundational ideas that form the basis of the subject}
-
-## Important Definitions
-{Key terms and their precise definitions, organized alphabetically}
-
-## Examples & Applications
-{Real-world examples and practical applications, with step-by-step explanations}
-
-## Common Misconceptions
-{Address frequently misunderstood aspects and clarify common mistakes}
-
-## Practice Problems
-{Sample problems with detailed solutions and explanations}
-
-## Quick Reference
-{Concise summary of key points, formulas, and concepts for quick review}
-
-## Further Reading
-{Recommended resources and references for deeper understanding}"""
-            },
-            "API Documentation": {
-                "type": "technical",
-                "content": """# {subject} API Documentation
-
-## API Overview
-{High-level overview of the API's purpose and capabilities}
-
-## Authentication
-{Authentication methods, API keys, tokens, and security requirements}
-
-## Base URL
-{Base URL structure and environment-specific endpoints}
-
-## Endpoints
-{Detailed documentation of each endpoint with request/response formats}
-
-## Request Parameters
-{Parameters, data types, validation rules, and examples}
-
-## Response Format
-{Response structure, status codes, and error handling}
-
-## Rate Limiting
-{Rate limits, quotas, and throttling policies}
-
-## Webhooks
-{Webhook configuration, payload formats, and event types}
-
-## SDK Examples
-{Code examples using popular programming languages}
-
-## Troubleshooting
-{Common issues, error codes, and resolution steps}"""
-            },
-            "Quick Reference": {
-                "type": "reference",
-                "content": """# {subject} Quick Reference
-
-## Syntax Guide
-{Essential syntax rules and commands with examples}
-
-## Common Operations
-{Frequently used operations and methods with usage patterns}
-
-## Data Structures
-{Key data structures and their implementations}
-
-## Algorithms
-{Common algorithms and their time/space complexity}
-
-## Tips & Tricks
-{Useful shortcuts, techniques, and best practices}
-
-## Gotchas
-{Common pitfalls to avoid and edge cases to consider}
-
-## Debugging Guide
-{Common debugging techniques and tools}
-
-## Resources
-{Links to documentation, tools, and learning resources}"""
-            },
-            "Concept Map": {
-                "type": "conceptual",
-                "content": """# {subject} Concept Map
-
-## Core Concept
-{Detailed explanation of the central idea or principle}
-
-## Related Concepts
-{Connected ideas and their relationships, with visual mapping}
-
-## Prerequisites
-{Foundation knowledge and skills required to understand the concept}
-
-## Applications
-{Practical applications and real-world use cases}
-
-## Advanced Topics
-{Further exploration paths and advanced concepts}
-
-## Visual Elements
-{Diagrams, flowcharts, and visual representations}
-
-## Cross-References
-{Links to related concepts and topics}
-
-## Learning Path
-{Recommended sequence for learning and mastering the concept}"""
-            },
-            "Language Learning": {
-                "type": "language",
-                "content": """# {subject} Language Guide
-
-## Grammar Rules
-{Essential grammar patterns and structures with examples}
-
-## Vocabulary
-{Key words and phrases organized by categories}
-
-## Common Expressions
-{Everyday useful expressions and idioms}
-
-## Cultural Notes
-{Cultural context, usage, and etiquette}
-
-## Practice Dialogues
-{Example conversations with translations}
-
-## Pronunciation Guide
-{Sound patterns, rules, and common pronunciation challenges}
-
-## Writing Guide
-{Writing styles, formats, and conventions}
-
-## Reading Comprehension
-{Strategies for understanding written text}
-
-## Listening Skills
-{Tips for improving listening comprehension}"""
-            },
-            "Code Review": {
-                "type": "coding",
-                "content": """# {subject} Code Review
-
-## Code Overview
-{High-level description of the code's purpose and functionality}
-
-## Architecture Review
-{Evaluation of code architecture and design patterns}
-
-## Code Quality
-{Assessment of code quality, readability, and maintainability}
-
-## Performance Analysis
-{Performance considerations and potential optimizations}
-
-## Security Review
-{Security vulnerabilities and best practices}
-
-## Test Coverage
-{Evaluation of test coverage and testing strategies}
-
-## Documentation Review
-{Assessment of code documentation and comments}
-
-## Best Practices
-{Alignment with coding standards and best practices}
-
-## Recommendations
-{Specific recommendations for improvement}
-
-## Action Items
-{Prioritized list of changes to implement}"""
-            },
-            "Algorithm Guide": {
-                "type": "algorithm",
-                "content": """# {subject} Algorithm Guide
-
-## Problem Statement
-{Clear definition of the problem and its constraints}
-
-## Algorithm Overview
-{High-level explanation of the algorithm approach}
-
-## Implementation
-{Detailed implementation with code examples}
-
-## Time Complexity
-{Analysis of time complexity with Big O notation}
-
-## Space Complexity
-{Analysis of space complexity and memory usage}
-
-## Edge Cases
-{Special cases and how to handle them}
-
-## Optimization
-{Techniques for optimizing the algorithm}
-
-## Applications
-{Real-world applications and use cases}
-
-## Related Algorithms
-{Similar algorithms and their differences}
-
-## Practice Problems
-{Sample problems to test understanding}"""
-            },
-            "Design Pattern": {
-                "type": "design",
-                "content": """# {subject} Design Pattern
-
-## Pattern Overview
-{Description of the design pattern and its purpose}
-
-## Problem Solved
-{Problems that this pattern addresses}
-
-## Solution Structure
-{Detailed explanation of the pattern structure}
-
-## Implementation
-{Code examples and implementation details}
-
-## Class Diagram
-{UML class diagram showing relationships}
-
-## Sequence Diagram
-{UML sequence diagram showing interactions}
-
-## Benefits
-{Advantages and benefits of using the pattern}
-
-## Drawbacks
-{Limitations and potential issues}
-
-## Real-world Examples
-{Examples of the pattern in real applications}
-
-## Related Patterns
-{Related patterns and their relationships}"""
-            },
-            "Project Setup": {
-                "type": "setup",
-                "content": """# {subject} Project Setup Guide
-
-## Prerequisites
-{Required software, tools, and dependencies}
-
-## Installation Steps
-{Step-by-step installation instructions}
+        default_templates = config.get_default_templates()
 
-## Configuration
-{Configuration files and environment setup}
+        # Get existing template names from database
+        existing_names = db.get_template_names()
 
-## Project Structure
-{Overview of project organization and files}
-
-## Development Setup
-{Development environment configuration}
-
-## Testing Setup
-{Testing environment and tools setup}
-
-## Deployment Setup
-{Deployment environment configuration}
-
-## CI/CD Setup
-{Continuous Integration/Deployment setup}
-
-## Documentation Setup
-{Documentation tools and setup}
-
-## Security Setup
-{Security configurations and best practices}"""
-            },
-            "Troubleshooting Guide": {
-                "type": "troubleshooting",
-                "content": """# {subject} Troubleshooting Guide
-
-## Common Issues
-{List of frequently encountered problems}
-
-## Error Messages
-{Common error messages and their meanings}
-
-## Diagnostic Steps
-{Step-by-step diagnostic procedures}
-
-## Solutions
-{Detailed solutions for each problem}
-
-## Prevention
-{Tips for preventing common issues}
-
-## Logging
-{How to enable and interpret logs}
-
-## Debug Tools
-{Available debugging tools and their usage}
-
-## Performance Issues
-{Common performance problems and solutions}
-
-## Security Issues
-{Security-related problems and fixes}
-
-## Recovery Procedures
-{Steps for recovering from failures}"""
-            }
-        }
+        # Add missing default templates in one write
+        missing_templates = [
+            {"name": name, "type": template['type'], "structure": template['content']}
+            for name, template in default_templates.items()
+            if name not in existing_names
+        ]
+        for template in missing_templates:
+            logger.info(f"Adding default template: {template['name']}")
+        templates_added = len(db.add_templates(missing_templates))
 
-        # Get existing templates from database
-        existing_templates = db.get_all_templates()
-        existing_names = {t['name'] for t in existing_templates}
-
-        # Add missing default templates
-        templates_added = 0
-        for name, template in default_templates.items():
-            if name not in existing_names:
-                logger.info(f"Adding default template: {name}")
-                success = db.add_template(
-                    name=name,
-                    type=template['type'],
-                    structure=template['content']
-                )
-                if success:
-                    templates_added += 1
+        if templates_added:
+            invalidate_templates_cache()
 
         logger.info(f"Default templates migration completed. Added {templates_added} new templates.")
         return True
@@ -407,19 +158,51 @@ def migrate_default_templates():
         logger.error(f"Error migrating default templates: {e}")
         return False
 
-# Call migration function when the application starts
-migrate_default_templates()
+def run_template_migration():
+    """Run the default templates migration and signal waiting writers when done."""
+    try:
+        migrate_default_templates()
+    finally:
+        _templates_migrated.set()
+
+def wait_for_template_migration():
+    """Block until the default templates migration has finished or timed out."""
+    if not _templates_migrated.wait(TEMPLATE_MIGRATION_TIMEOUT_SECONDS):
+        logger.warning("Default templates migration is still running")
+
+# Migrate default templates in the background so startup is not blocked on the database
+threading.Thread(target=run_template_migration, name="template-migration", daemon=True).start()
+
+def warm_up_generators():
+    """Import the generators module so the first request does not pay for it.
+    
+    This loads LangChain and creates the OpenAI client and token tracker.
+    """
+    try:
+        _generators()
+        logger.info("LLM client warmed up")
+    except Exception as e:
+        logger.error(f"Error warming up LLM client: {e}")
+
+# Warm up the LLM client in the background while Gradio starts serving
+threading.Thread(target=warm_up_generators, name="llm-warmup", daemon=True).start()
 
-def generate_cheatsheet_and_summarize(prompt, theme, subject, template_name, style, exemplified, complexity, audience, enforce_formatting):
-    """Generates a cheatsheet and creates a summary for use in other features."""
+async def generate_cheatsheet_and_summarize(prompt, theme, subject, template_name, style, exemplified, complexity, audience, enforce_formatting,
+                                            progress=gr.Progress()):
+    """Generates a cheatsheet and creates a summary for use in other features.
+    
+    Progress is reported through Gradio's built-in progress indicator.
+    """
+    progress(0, desc="🔄 Generating cheatsheet...")
     try:
-        cheatsheet, raw_cheatsheet = generate_cheatsheet(
+        cheatsheet, raw_cheatsheet = await _generators().generate_cheatsheet(
             prompt, theme, subject, template_name, style,
             exemplified, complexity, audience, enforce_formatting
         )
         
         # Create a summary of the cheatsheet for use in other features
-        summarized_content = summarize_content_for_features(cheatsheet)
+        progress(0.5, desc="🔄 Summarizing cheatsheet...")
+        summarized_content = await _generators().summarize_content_for_features(cheatsheet)
         
         return cheatsheet, raw_cheatsheet, summarized_content
     except Exception as e:
@@ -427,60 +210,128 @@ def generate_cheatsheet_and_summarize(prompt, theme, subject, template_name, sty
         error_message = f"Error: {str(e)}"
         return error_message, error_message, ""
 
-def update_template_list(template_search: str, template_filter: str) -> List[List[str]]:
-    """Update the template list with search and filter functionality."""
-    try:
-        # Get all templates from database
-        templates = db.get_all_templates()
-        formatted_templates = []
-        
-        for template in templates:
-            try:
-                # Parse ISO format timestamp
-                updated_at = datetime.fromisoformat(template['updated_at'])
-                formatted_date = updated_at.strftime('%Y-%m-%d')
-                
-                formatted_templates.append([
-                    template['name'],
-                    template['type'],
-                    formatted_date
-                ])
-            except (ValueError, TypeError) as e:
-                logger.warning(f"Error formatting template date: {e}")
-                # Use current date as fallback
-                formatted_date = datetime.now().strftime('%Y-%m-%d')
-                formatted_templates.append([
-                    template['name'],
-                    template['type'],
-                    formatted_date
-                ])
-        
-        # Apply search filter if provided
-        if template_search:
-            search_lower = template_search.lower()
-            formatted_templates = [
-                t for t in formatted_templates 
-                if search_lower in t[0].lower()
-            ]
+@lru_cache(maxsize=4096)
+def iso_to_ymd(iso_timestamp: str) -> str:
+    """Convert an ISO format timestamp to YYYY-MM-DD, memoized per timestamp."""
+    return datetime.fromisoformat(iso_timestamp).strftime('%Y-%m-%d')
+
+def format_template_rows(templates: List[dict]) -> List[List[str]]:
+    """Format templates as [name, type, updated date] rows for the template list."""
+    formatted_templates = []
+    for template in templates:
+        try:
+            formatted_date = iso_to_ymd(template['updated_at'])
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Error formatting template date: {e}")
+            # Use current date as fallback
+            formatted_date = datetime.now().strftime('%Y-%m-%d')
+        formatted_templates.append([
+            template['name'],
+            template['type'],
+            formatted_date
+        ])
+    return formatted_templates
+
+def query_templates(template_search: str, template_filter: str) -> List[List[str]]:
+    """Get template rows matching a search term and type filter.
+    
+    Results are cached per query against the current cached template list, so
+    repeated searches do not re-format and re-filter every template.
+    
+    Args:
+        template_search: Case-insensitive substring of the template name
+        template_filter: Template type, or 'all' for every type
         
-        # Apply type filter if provided
-        if template_filter and template_filter != 'all':
-            formatted_templates = [
-                t for t in formatted_templates 
-                if t[1].lower() == template_filter.lower()
-            ]
+    Returns:
+        List[List[str]]: Matching [name, type, updated date] rows
+    """
+    templates = get_cached_templates()
+    search_lower = (template_search or "").strip().lower()
+    filter_lower = (template_filter or "all").lower()
+    key = ("query", search_lower, filter_lower)
+    
+    with _templates_cache_lock:
+        cached = _templates_cache["entries"].get(key)
+    if cached is not None and cached[0] is templates:
+        return cached[1]
+    
+    # Filter before formatting so discarded templates never have their dates parsed
+    matching = templates
+    if search_lower:
+        matching = [t for t in matching if search_lower in t['name'].lower()]
+    if filter_lower != 'all':
+        matching = [t for t in matching if t['type'].lower() == filter_lower]
+    
+    rows = format_template_rows(matching)
+    
+    with _templates_cache_lock:
+        entries = _templates_cache["entries"]
+        # Only cache results derived from the current template list
+        if entries.get("templates") is templates:
+            # Evict the oldest query result; the template list and name map are kept
+            query_keys = [k for k in entries if isinstance(k, tuple) and k[0] == "query"]
+            if len(query_keys) >= TEMPLATE_QUERY_CACHE_SIZE:
+                del entries[query_keys[0]]
+            entries[key] = (templates, rows)
+    return rows
+
+def get_cached_template(template_name: str) -> Optional[dict]:
+    """Look up a template by name in the cached template list.
+    
+    The name-to-template mapping is built once per cached template list, and
+    names missing from it are looked up in the database in case the cache is stale.
+    
+    Args:
+        template_name: Name of the template
         
-        return formatted_templates, gr.update(choices=[t[0] for t in formatted_templates])
+    Returns:
+        Optional[dict]: The template, or None if it does not exist
+    """
+    templates = get_cached_templates()
+    with _templates_cache_lock:
+        cached = _templates_cache["entries"].get(("by_name",))
+    if cached is not None and cached[0] is templates:
+        by_name = cached[1]
+    else:
+        by_name = {t['name']: t for t in templates}
+        with _templates_cache_lock:
+            if _templates_cache["entries"].get("templates") is templates:
+                _templates_cache["entries"][("by_name",)] = (templates, by_name)
+    
+    template = by_name.get(template_name)
+    if template is None:
+        template = db.get_template_by_name(template_name)
+    return template
+
+def update_template_list(template_search: str, template_filter: str, shown_choices_key: Optional[int] = None):
+    """Update the template list with search and filter functionality.
+    
+    Args:
+        template_search: Case-insensitive substring of the template name
+        template_filter: Template type, or 'all' for every type
+        shown_choices_key: Key of the selector choices the session already shows;
+            the choices are only sent again when they change
+            
+    Returns:
+        Tuple of (template rows, template selector update, choices key)
+    """
+    try:
+        formatted_templates = query_templates(template_search, template_filter)
+        names = tuple(t[0] for t in formatted_templates)
+        choices_key = hash(names)
+        if choices_key == shown_choices_key:
+            return formatted_templates, gr.update(), choices_key
+        return formatted_templates, gr.update(choices=list(names)), choices_key
         
     except Exception as e:
         logger.error(f"Error updating template list: {e}")
-        return [], gr.update(choices=[])
+        return [], gr.update(choices=[]), None
 
 def update_template_dropdown():
     """Update the template dropdown with all available templates."""
     try:
-        # Get all templates from config (includes both default and custom)
-        all_templates = list(config.get_instance().get_templates().keys())
+        # Get all templates from the cache (includes both default and custom)
+        all_templates = [template['name'] for template in get_cached_templates()]
         return gr.update(choices=all_templates)
     except Exception as e:
         logger.error(f"Error updating template dropdown: {e}")
@@ -489,15 +340,14 @@ def update_template_dropdown():
 def save_template(name, type, content):
     """Save template to database."""
     if not name or not content:
-        return "Template name and content are required", update_template_list("", "all")
+        return ("Template name and content are required", *update_template_list("", "all"), gr.update())
     
     try:
-        # Check if template already exists
-        db = DatabaseInstance.get_instance()
-        templates = db.get_all_templates()
+        # Avoid racing the migration when saving a template with a default name
+        wait_for_template_migration()
         
-        # Find the template by name
-        existing_template = next((t for t in templates if t['name'] == name), None)
+        # Check if template already exists
+        existing_template = db.get_template_by_name(name)
         
         if existing_template:
             # Update existing template
@@ -507,14 +357,13 @@ def save_template(name, type, content):
             # Create new template
             db.add_template(name, type, content)
             message = f"Template '{name}' saved successfully"
+        invalidate_templates_cache()
         
-        # Update UI components
-        templates, dropdown = update_template_list("", "all")
-        
-        return message, templates, dropdown
+        # Update the template list and the cheatsheet template dropdown from the same cached read
+        return (message, *update_template_list("", "all"), update_template_dropdown())
     except Exception as e:
         logger.error(f"Error saving template: {e}")
-        return f"Error saving template: {str(e)}", update_template_list("", "all"), gr.update(choices=[])
+        return (f"Error saving template: {str(e)}", *update_template_list("", "all"), gr.update())
 
 def delete_template(template_name):
     """Show delete confirmation dialog."""
@@ -534,27 +383,26 @@ def confirm_delete(template_name):
     """Delete the selected template after confirmation."""
     # Check if template_name is empty or None
     if not template_name:
-        templates, dropdown = update_template_list("", "all")
-        return "No template selected", templates, dropdown, gr.update(visible=False), gr.update(visible=False), gr.update(visible=False)
+        templates, dropdown, choices_key = update_template_list("", "all")
+        return "No template selected", templates, dropdown, gr.update(visible=False), gr.update(visible=False), gr.update(visible=False), choices_key, gr.update()
     
     try:
-        # Get template from database
-        db = DatabaseInstance.get_instance()
-        templates = db.get_all_templates()
+        wait_for_template_migration()
         
-        # Find the template by name
-        template = next((t for t in templates if t['name'] == template_name), None)
+        # Get template from database
+        template = db.get_template_by_name(template_name)
         
         if template:
             # Delete the template using its ID
             success = db.delete_template(template['id'])
             if not success:
                 raise RuntimeError("Failed to delete template from database")
+            invalidate_templates_cache()
         else:
             raise ValueError(f"Template '{template_name}' not found")
         
         # Update UI components
-        templates, dropdown = update_template_list("", "all")
+        templates, dropdown, choices_key = update_template_list("", "all")
         
         return (
             f"Template '{template_name}' deleted successfully",
@@ -562,263 +410,513 @@ def confirm_delete(template_name):
             dropdown,
             gr.update(visible=False),
             gr.update(visible=False),
-            gr.update(visible=False)
+            gr.update(visible=False),
+            choices_key,
+            update_template_dropdown()
         )
     except Exception as e:
         logger.error(f"Error deleting template: {e}")
-        templates, dropdown = update_template_list("", "all")
+        templates, dropdown, choices_key = update_template_list("", "all")
         return (
             f"Error deleting template: {str(e)}",
             templates,
             dropdown,
             gr.update(visible=False),
             gr.update(visible=False),
-            gr.update(visible=False)
+            gr.update(visible=False),
+            choices_key,
+            gr.update()
         )
 
-def quiz_with_check(summarized_content, quiz_type, difficulty, quiz_count):
+async def quiz_with_check(summarized_content, quiz_type, difficulty, quiz_count, progress=gr.Progress()):
     """Generate a quiz with error handling."""
     if not summarized_content:
-        return "Please generate a cheatsheet first", "No content available for quiz generation"
+        yield "Please generate a cheatsheet first", "No content available for quiz generation"
+        return
     
+    progress(0, desc="🔄 Generating quiz...")
     try:
-        quiz = generate_quiz(summarized_content, quiz_type, difficulty, quiz_count)
-        return quiz, quiz
+        # The progress indicator stays up until the first chunk arrives
+        async for quiz in _generators().generate_quiz(summarized_content, quiz_type, difficulty, quiz_count):
+            yield quiz, quiz
     except Exception as e:
         logger.error(f"Error generating quiz: {e}")
         error_message = f"Error generating quiz: {str(e)}"
-        return error_message, error_message
+        yield error_message, error_message
 
-def flashcards_with_check(summarized_content, flashcard_count):
+async def flashcards_with_check(summarized_content, flashcard_count, progress=gr.Progress()):
     """Generate flashcards with error handling."""
     if not summarized_content:
-        return "Please generate a cheatsheet first", "No content available for flashcard generation"
+        yield "Please generate a cheatsheet first", "No content available for flashcard generation"
+        return
     
+    progress(0, desc="🔄 Generating flashcards...")
     try:
-        flashcards = generate_flashcards(summarized_content, flashcard_count)
-        return flashcards, flashcards
+        # The progress indicator stays up until the first chunk arrives
+        async for flashcards in _generators().generate_flashcards(summarized_content, flashcard_count):
+            yield flashcards, flashcards
     except Exception as e:
         logger.error(f"Error generating flashcards: {e}")
         error_message = f"Error generating flashcards: {str(e)}"
-        return error_message, error_message
+        yield error_message, error_message
 
-def problems_with_check(summarized_content, problem_type, problem_count):
+async def problems_with_check(summarized_content, problem_type, problem_count, progress=gr.Progress()):
     """Generate practice problems with error handling."""
     if not summarized_content:
-        return "Please generate a cheatsheet first", "No content available for problem generation"
+        yield "Please generate a cheatsheet first", "No content available for problem generation"
+        return
     
+    progress(0, desc="🔄 Generating practice problems...")
     try:
-        problems = generate_practice_problems(summarized_content, problem_type, problem_count)
-        return problems, problems
+        # The progress indicator stays up until the first chunk arrives
+        async for problems in _generators().generate_practice_problems(summarized_content, problem_type, problem_count):
+            yield problems, problems
     except Exception as e:
         logger.error(f"Error generating practice problems: {e}")
         error_message = f"Error generating practice problems: {str(e)}"
-        return error_message, error_message
+        yield error_message, error_message
 
-def summary_with_check(summarized_content, summary_level, summary_focus):
+async def summary_with_check(summarized_content, summary_level, summary_focus, progress=gr.Progress()):
     """Generate a summary with error handling."""
     if not summarized_content:
-        return "Please generate a cheatsheet first", "No content available for summary generation"
+        yield "Please generate a cheatsheet first", "No content available for summary generation"
+        return
     
+    progress(0, desc="🔄 Generating summary...")
     try:
-        summary = generate_summary(summarized_content, summary_level, summary_focus)
-        return summary, summary
+        # The progress indicator stays up until the first chunk arrives
+        async for summary in _generators().generate_summary(summarized_content, summary_level, summary_focus):
+            yield summary, summary
     except Exception as e:
         logger.error(f"Error generating summary: {e}")
         error_message = f"Error generating summary: {str(e)}"
-        return error_message, error_message
+        yield error_message, error_message
+
+async def _drain_generator(step, last):
+    """Run a handler generator to completion and return its final outputs."""
+    async for last in step:
+        pass
+    return last
+
+async def generate_all_study_aids(summarized_content, quiz_type, difficulty, quiz_count,
+                                  flashcard_count, problem_type, problem_count,
+                                  summary_level, summary_focus, progress=gr.Progress()):
+    """Generate the quiz, flashcards, practice problems and summary concurrently.
+    
+    The feature handlers await their LLM calls on the event loop, so the total
+    wait is the slowest request rather than the sum of all four.
+    """
+    progress(0, desc="🔄 Generating study aids...")
+    steps = [
+        quiz_with_check(summarized_content, quiz_type, difficulty, quiz_count),
+        flashcards_with_check(summarized_content, flashcard_count),
+        problems_with_check(summarized_content, problem_type, problem_count),
+        summary_with_check(summarized_content, summary_level, summary_focus),
+    ]
+    
+    results = await asyncio.gather(*(
+        _drain_generator(step, (gr.update(), gr.update()))
+        for step in steps
+    ))
+    return tuple(value for outputs in results for value in outputs)
+
+def run_in_thread(func):
+    """Wrap a blocking handler in a coroutine that runs it in a worker thread.
+    
+    Gradio awaits the coroutine on the event loop, while the database work
+    stays off the loop.
+    """
+    @wraps(func)
+    async def wrapper(*args):
+        return await asyncio.to_thread(func, *args)
+    return wrapper
+
+def format_page_info(page: int, page_size: int, total_count: int) -> str:
+    """Describe which rows of the result set are currently displayed."""
+    if total_count == 0:
+        return "No results"
+    first_row = min(page * page_size + 1, total_count)
+    last_row = min((page + 1) * page_size, total_count)
+    return f"Showing rows {first_row}-{last_row} of {total_count}"
+
+def format_usage_by_function(usage_rows, total_tokens: int) -> str:
+    """Format per-function usage as a markdown table.
+    
+    Args:
+        usage_rows: Iterable of (function name, total tokens, total cost) tuples
+        total_tokens: Total tokens across all functions, used for the percentages
+        
+    Returns:
+        str: Markdown table, or a placeholder when there are no rows
+    """
+    usage_rows = list(usage_rows)
+    if not usage_rows:
+        return NO_USAGE_BY_FUNCTION
+    
+    # Compute every percentage in one vectorized pass
+    names, tokens, costs = zip(*usage_rows)
+    tokens = np.asarray(tokens, dtype=np.int64)
+    costs = np.asarray(costs, dtype=np.float64)
+    percentages = tokens / total_tokens * 100 if total_tokens > 0 else np.zeros(len(tokens))
+    
+    rows = [
+        "### Usage by Function\n",
+        "| Function | Total Tokens | Total Cost | % of Total |",
+        "|----------|--------------|------------|------------|",
+    ]
+    rows.extend(
+        f"| {func_name} | {func_tokens:,} | ${func_cost:.4f} | {percentage:.1f}% |"
+        for func_name, func_tokens, func_cost, percentage in zip(
+            names, tokens.tolist(), costs.tolist(), percentages.tolist()
+        )
+    )
+    return "\n".join(rows) + "\n"
+
+def format_usage_summary(summary: dict):
+    """Format a usage summary as the stats table and usage by function table.
+    
+    Args:
+        summary: Usage summary with total_tokens, total_cost, total_calls and by_function
+        
+    Returns:
+        Tuple of (stats table rows, usage by function markdown)
+    """
+    stats_table = format_stats_table(summary['total_tokens'], summary['total_cost'], summary['total_calls'])
+    usage_table = format_usage_by_function(
+        ((name, usage['total_tokens'], usage['total_cost']) for name, usage in summary['by_function'].items()),
+        summary['total_tokens']
+    )
+    return stats_table, usage_table
+
+def build_usage_outputs(logs, page: int = 0, page_size: Optional[int] = None, summary: Optional[dict] = None):
+    """Build the table rows, overview stats and usage by function for a set of logs.
+    
+    Args:
+        logs: List of log dictionaries
+        page: Zero-based page of rows to display
+        page_size: Number of rows per page, or None to display every row
+        summary: Optional precomputed usage summary to show instead of aggregating logs
+        
+    Returns:
+        Tuple of (page rows as a DataFrame, page info, stats table rows, usage by function markdown)
+    """
+    # Only the visible page is formatted and sent to the browser
+    if page_size:
+        page_logs = logs[page * page_size:(page + 1) * page_size]
+    else:
+        page_size = max(len(logs), 1)
+        page_logs = logs
+    formatted_logs = LogFormatter.format_as_dataframe(page_logs)
+    page_info = format_page_info(page, page_size, len(logs))
+    
+    if summary is not None:
+        return (formatted_logs, page_info) + format_usage_summary(summary)
+    
+    # Load the numeric columns once and aggregate them in vectorized passes
+    usage = pd.DataFrame(logs, columns=['function_name', 'total_tokens', 'cost'])
+    total_tokens = int(usage['total_tokens'].sum())
+    total_cost = float(usage['cost'].sum())
+    
+    # Format the overview statistics
+    stats_table = format_stats_table(total_tokens, total_cost, len(usage))
+    
+    # Calculate and format usage by function
+    by_function = usage.groupby('function_name', sort=False)[['total_tokens', 'cost']].sum()
+    usage_table = format_usage_by_function(
+        zip(by_function.index, by_function['total_tokens'], by_function['cost']),
+        total_tokens
+    )
+    
+    return formatted_logs, page_info, stats_table, usage_table
 
 def update_logs():
     """Update the token usage logs table."""
     try:
-        logs = get_token_logs()
+        logs = _generators().get_token_logs()
         if not logs:
-            return [], EMPTY_STATS_TABLE, "No usage data available by function"
-        
-        # Format logs for display
-        formatted_logs = []
-        for log in logs:
-            formatted_logs.append([
-                log['timestamp'],
-                log['function_name'],
-                log['prompt_tokens'],
-                log['completion_tokens'],
-                log['total_tokens'],
-                f"${log['cost']:.4f}"
-            ])
+            return [], "No results", EMPTY_STATS_TABLE, NO_USAGE_BY_FUNCTION
         
-        # Calculate totals
-        total_tokens = sum(log['total_tokens'] for log in logs)
-        total_cost = sum(log['cost'] for log in logs)
-        total_calls = len(logs)
-        
-        # Calculate averages
-        avg_tokens = total_tokens / total_calls if total_calls > 0 else 0
-        avg_cost = total_cost / total_calls if total_calls > 0 else 0
-        
-        # Format the overview statistics
-        stats_table = f"""
-        | Metric | Value |
-        |--------|-------|
-        | Total Tokens | {total_tokens:,} |
-        | Total Cost | ${total_cost:.4f} |
-        | Avg Tokens/Call | {avg_tokens:,.1f} |
-        | Avg Cost/Call | ${avg_cost:.4f} |
-        """
-        
-        # Calculate and format usage by function
-        usage_by_function = calculate_total_usage_by_function(logs)
-        if not usage_by_function:
-            return formatted_logs, stats_table, "No usage data available by function"
-        
-        # Format the usage statistics as a markdown table
-        table = "### Usage by Function\n\n"
-        table += "| Function | Total Tokens | Total Cost | % of Total |\n"
-        table += "|----------|--------------|------------|------------|\n"
-        
-        for func_name, stats in usage_by_function.items():
-            token_percentage = (stats['total_tokens'] / total_tokens * 100) if total_tokens > 0 else 0
-            cost_percentage = (stats['total_cost'] / total_cost * 100) if total_cost > 0 else 0
-            table += f"| {func_name} | {stats['total_tokens']:,} | ${stats['total_cost']:.4f} | {token_percentage:.1f}% |\n"
-        
-        return formatted_logs, stats_table, table
+        # Stats cover every log, aggregated from metadata only
+        return build_usage_outputs(logs, summary=_generators().get_token_usage_summary())
         
     except Exception as e:
         logger.error(f"Error updating logs: {e}")
-        return [], EMPTY_STATS_TABLE, f"Error updating logs: {str(e)}"
+        return [], "", EMPTY_STATS_TABLE, f"Error updating logs: {str(e)}"
+
+def build_log_query(start_date, end_date, function_name, min_tokens, max_tokens, min_cost, max_cost, limit) -> dict:
+    """Build the log query for the smart filter inputs.
+    
+    Returns:
+        dict: Query with the ChromaDB where clause and the result limit
+    """
+    query_builder = LogQueryBuilder()
+    
+    if start_date:
+        query_builder.add_date_range(start_date, end_date or datetime.now().strftime('%Y-%m-%d'))
+    
+    if function_name:
+        query_builder.add_function_filter(function_name)
+    
+    if min_tokens is not None and max_tokens is not None:
+        query_builder.add_token_range(min_tokens, max_tokens)
+    
+    if min_cost is not None and max_cost is not None:
+        query_builder.add_cost_range(min_cost, max_cost)
+    
+    # A limit of 0 is a valid "no rows" request, not a missing limit
+    if limit is not None:
+        query_builder.set_limit(int(limit))
+    
+    return query_builder.build()
+
+_filter_summary_cache: "OrderedDict[str, dict]" = OrderedDict()
+_filter_summary_lock = threading.Lock()
+
+def get_filter_summary(where: Optional[dict], limit: int, refresh: bool = False) -> dict:
+    """Get the usage summary of the logs a filter returns.
+    
+    The summary covers at most `limit` logs, the same rows the filter pages
+    through. Applying a filter recomputes it; turning pages reuses the one
+    computed for the same query instead of reading the logs again.
+    
+    Args:
+        where: ChromaDB where clause, or None for all logs
+        limit: Maximum number of logs the filter returns
+        refresh: Recompute the summary even if one is cached
+        
+    Returns:
+        dict: Output of db.get_usage_summary for the query
+    """
+    key = json.dumps([where, limit], sort_keys=True, default=str)
+    if not refresh:
+        with _filter_summary_lock:
+            summary = _filter_summary_cache.get(key)
+            if summary is not None:
+                _filter_summary_cache.move_to_end(key)
+                return summary
+    
+    summary = db.get_usage_summary(where, limit)
+    with _filter_summary_lock:
+        _filter_summary_cache[key] = summary
+        _filter_summary_cache.move_to_end(key)
+        while len(_filter_summary_cache) > FILTER_SUMMARY_CACHE_SIZE:
+            _filter_summary_cache.popitem(last=False)
+    return summary
+
+def query_filter_page(query_dict: dict, summary: dict, page: int, page_size: int):
+    """Fetch one page of the logs matching a filter.
+    
+    Pages past the end are clamped to the last page, so moving forward from
+    the last page leaves it unchanged.
+    
+    Args:
+        query_dict: Query built by build_log_query
+        summary: Usage summary of the logs the query returns
+        page: Zero-based page number
+        page_size: Rows per page
+        
+    Returns:
+        Tuple of (displayed page, logs table, page info)
+    """
+    total_count = min(summary['total_calls'], int(query_dict["limit"]))
+    if not total_count:
+        return 0, [], "No results"
+    
+    page = min(page, (total_count - 1) // page_size)
+    offset = page * page_size
+    page_logs = db.query_logs(
+        {"where": query_dict["where"], "limit": min(page_size, total_count - offset)},
+        offset=offset
+    )
+    
+    return (
+        page,
+        LogFormatter.format_as_dataframe(page_logs),
+        format_page_info(page, page_size, total_count)
+    )
 
-def apply_combined_filters(start_date, end_date, function_name, min_tokens, max_tokens, min_cost, max_cost, limit):
-    """Apply combined filters to token usage logs."""
+def apply_combined_filters(start_date, end_date, function_name, min_tokens, max_tokens, min_cost, max_cost, limit, page=0, page_size=50):
+    """Apply combined filters to token usage logs and return the first page of results.
+    
+    A new filter always starts on the first page, so the current page input
+    is ignored and 0 is returned as the page to display.
+    """
     try:
         # Validate date format
         if start_date and not validate_date_format(start_date):
-            return [], EMPTY_STATS_TABLE
+            return 0, [], "Invalid start date", EMPTY_STATS_TABLE, NO_USAGE_BY_FUNCTION
         if end_date and not validate_date_format(end_date):
-            return [], EMPTY_STATS_TABLE
-        
-        # Build query
-        query_builder = LogQueryBuilder()
-        
-        if start_date:
-            query_builder.add_date_range(start_date, end_date or datetime.now().strftime('%Y-%m-%d'))
-        
-        if function_name:
-            query_builder.add_function_filter(function_name)
-        
-        if min_tokens is not None:
-            query_builder.add_token_range(min_tokens, max_tokens)
-        
-        if min_cost is not None:
-            query_builder.add_cost_range(min_cost, max_cost)
-        
-        if limit:
-            query_builder.set_limit(limit)
-        
-        # Execute query
-        query_dict = query_builder.build()
-        logs = db.query_logs(query_dict)
-        
-        if not logs:
-            return [], EMPTY_STATS_TABLE
-        
-        # Format logs for display
-        formatted_logs = []
-        for log in logs:
-            formatted_logs.append([
-                log['timestamp'].strftime("%Y-%m-%d %H:%M:%S") if isinstance(log['timestamp'], datetime) else log['timestamp'],
-                log['function_name'],
-                log['prompt_tokens'],
-                log['completion_tokens'],
-                log['total_tokens'],
-                f"${log['cost']:.4f}"
-            ])
+            return 0, [], "Invalid end date", EMPTY_STATS_TABLE, NO_USAGE_BY_FUNCTION
         
-        # Calculate totals for filtered data
-        total_tokens = sum(log['total_tokens'] for log in logs)
-        total_cost = sum(log['cost'] for log in logs)
-        total_calls = len(logs)
+        # Normalize pagination inputs
+        page_size = max(int(page_size or 50), 1)
         
-        # Calculate averages
-        avg_tokens = total_tokens / total_calls if total_calls > 0 else 0
-        avg_cost = total_cost / total_calls if total_calls > 0 else 0
+        # Aggregate the returned logs from metadata, then fetch only the visible page
+        query_dict = build_log_query(start_date, end_date, function_name, min_tokens, max_tokens, min_cost, max_cost, limit)
+        if query_dict["limit"] == 0:
+            return 0, [], "No results", EMPTY_STATS_TABLE, NO_USAGE_BY_FUNCTION
+        summary = get_filter_summary(query_dict["where"], int(query_dict["limit"]), refresh=True)
+        if not summary['total_calls']:
+            return 0, [], "No results", EMPTY_STATS_TABLE, NO_USAGE_BY_FUNCTION
         
-        # Format the overview statistics
-        stats_table = f"""
-        | Metric | Value |
-        |--------|-------|
-        | Total Tokens | {total_tokens:,} |
-        | Total Cost | ${total_cost:.4f} |
-        | Avg Tokens/Call | {avg_tokens:,.1f} |
-        | Avg Cost/Call | ${avg_cost:.4f} |
-        """
-        
-        return formatted_logs, stats_table
+        return query_filter_page(query_dict, summary, 0, page_size) + format_usage_summary(summary)
         
     except Exception as e:
         logger.error(f"Error applying filters: {e}")
-        return [], EMPTY_STATS_TABLE
+        return gr.update(), [], "", EMPTY_STATS_TABLE, f"Error applying filters: {str(e)}"
 
-def update_usage_by_function():
-    """Update the usage by function statistics."""
+# Exports are written to one directory per process, removed when the process exits
+EXPORT_DIR = tempfile.mkdtemp(prefix="token_logs_")
+atexit.register(shutil.rmtree, EXPORT_DIR, ignore_errors=True)
+_last_export_path: Optional[str] = None
+_export_lock = threading.Lock()
+
+def _replace_last_export(path: str) -> None:
+    """Remember the newest export and delete the one before it.
+    
+    Gradio copies returned files into its own cache, so the previous export
+    is no longer needed once a new one has been written.
+    """
+    global _last_export_path
+    with _export_lock:
+        previous, _last_export_path = _last_export_path, path
+    if previous:
+        try:
+            os.remove(previous)
+        except OSError as e:
+            logger.warning(f"Could not remove previous export {previous}: {e}")
+
+def export_logs(start_date, end_date, function_name, min_tokens, max_tokens, min_cost, max_cost, limit):
+    """Write the logs matching the smart filter to a CSV file for download.
+    
+    Logs are read and written in batches, so memory use does not grow with
+    the number of exported rows.
+    
+    Returns:
+        Optional[str]: Path of the CSV file, or None if the export failed
+    """
     try:
-        usage_by_function = calculate_total_usage_by_function()
-        if not usage_by_function:
-            stats_table = """
-            | Metric | Value |
-            |--------|-------|
-            | Total Tokens | 0 |
-            | Total Cost | $0.00 |
-            | Avg Tokens/Call | 0 |
-            | Avg Cost/Call | $0.00 |
-            """
-            return "No usage data available by function", stats_table
-        
-        # Calculate totals
-        total_tokens = sum(stats['total_tokens'] for stats in usage_by_function.values())
-        total_cost = sum(stats['total_cost'] for stats in usage_by_function.values())
-        total_calls = len(usage_by_function)
-        
-        # Calculate averages
-        avg_tokens = total_tokens / total_calls if total_calls > 0 else 0
-        avg_cost = total_cost / total_calls if total_calls > 0 else 0
-        
-        # Format the usage statistics as a markdown table
-        table = "### Usage by Function\n\n"
-        table += "| Function | Total Tokens | Total Cost | % of Total |\n"
-        table += "|----------|--------------|------------|------------|\n"
+        if start_date and not validate_date_format(start_date):
+            raise ValueError("Invalid start date")
+        if end_date and not validate_date_format(end_date):
+            raise ValueError("Invalid end date")
         
-        for func_name, stats in usage_by_function.items():
-            token_percentage = (stats['total_tokens'] / total_tokens * 100) if total_tokens > 0 else 0
-            cost_percentage = (stats['total_cost'] / total_cost * 100) if total_cost > 0 else 0
-            table += f"| {func_name} | {stats['total_tokens']:,} | ${stats['total_cost']:.4f} | {token_percentage:.1f}% |\n"
+        query_dict = build_log_query(start_date, end_date, function_name, min_tokens, max_tokens, min_cost, max_cost, limit)
+        with tempfile.NamedTemporaryFile(
+            "w", newline="", encoding="utf-8", prefix="token_logs_", suffix=".csv",
+            dir=EXPORT_DIR, delete=False
+        ) as export_file:
+            writer = csv.writer(export_file)
+            writer.writerow(LOG_TABLE_HEADERS)
+            for batch in db.iter_logs(query_dict["where"], int(query_dict["limit"])):
+                writer.writerows(
+                    (
+                        LogFormatter.format_timestamp(log['timestamp']),
+                        log['function_name'],
+                        log['prompt_tokens'],
+                        log['completion_tokens'],
+                        log['total_tokens'],
+                        log['cost']
+                    )
+                    for log in batch
+                )
+        _replace_last_export(export_file.name)
+        return export_file.name
+    except Exception as e:
+        logger.error(f"Error exporting logs: {e}")
+        return None
+
+def change_filter_page(step: int):
+    """Build a handler that moves the filtered results by a number of pages.
+    
+    Only the logs table and page info change; the statistics of the filter
+    stay as they are and its summary is reused from the last apply.
+    
+    Args:
+        step: Pages to move, negative to go back
         
-        # Format the overview statistics
-        stats_table = f"""
-        | Metric | Value |
-        |--------|-------|
-        | Total Tokens | {total_tokens:,} |
-        | Total Cost | ${total_cost:.4f} |
-        | Avg Tokens/Call | {avg_tokens:,.1f} |
-        | Avg Cost/Call | ${avg_cost:.4f} |
-        """
+    Returns:
+        Handler taking the smart filter inputs and returning the new page,
+        logs table and page info
+    """
+    def handler(start_date, end_date, function_name, min_tokens, max_tokens, min_cost, max_cost, limit, page, page_size):
+        page = max(int(page or 0) + step, 0)
+        try:
+            if start_date and not validate_date_format(start_date):
+                return page, [], "Invalid start date"
+            if end_date and not validate_date_format(end_date):
+                return page, [], "Invalid end date"
+            
+            page_size = max(int(page_size or 50), 1)
+            query_dict = build_log_query(start_date, end_date, function_name, min_tokens, max_tokens, min_cost, max_cost, limit)
+            if query_dict["limit"] == 0:
+                return page, [], "No results"
+            summary = get_filter_summary(query_dict["where"], int(query_dict["limit"]))
+            return query_filter_page(query_dict, summary, page, page_size)
+        except Exception as e:
+            logger.error(f"Error changing page: {e}")
+            return page, [], f"Error changing page: {str(e)}"
+    return handler
+
+def update_usage_by_function():
+    """Update the usage by function statistics."""
+    try:
+        summary = _generators().get_token_usage_summary()
+        if not summary['total_calls']:
+            return NO_USAGE_BY_FUNCTION, EMPTY_STATS_TABLE
         
+        stats_table, table = format_usage_summary(summary)
         return table, stats_table
     except Exception as e:
         logger.error(f"Error updating usage by function: {e}")
-        stats_table = """
-        | Metric | Value |
-        |--------|-------|
-        | Total Tokens | 0 |
-        | Total Cost | $0.00 |
-        | Avg Tokens/Call | 0 |
-        | Avg Cost/Call | $0.00 |
-        """
-        return f"Error updating usage by function: {str(e)}", stats_table
+        return f"Error updating usage by function: {str(e)}", EMPTY_STATS_TABLE
+
+def refresh_function_choices():
+    """Reload the function filter choices, bypassing the cached function names."""
+    _generators().invalidate_functions_cache()
+    return gr.Dropdown(choices=_generators().get_unique_functions_cached())
+
+def load_function_choices(loaded: bool):
+    """Populate the function filter choices once per session.
+    
+    Args:
+        loaded: Whether the choices were already loaded in this session
+        
+    Returns:
+        Tuple of (function filter update, loaded flag)
+    """
+    if loaded:
+        return gr.update(), True
+    return gr.Dropdown(choices=_generators().get_unique_functions_cached()), True
+
+def refresh_analytics():
+    """Refresh the logs table, usage statistics and function filter in one event.
+    
+    Returns:
+        Tuple of the update_logs outputs followed by the function filter update
+    """
+    try:
+        function_choices = refresh_function_choices()
+    except Exception as e:
+        logger.error(f"Error refreshing function choices: {e}")
+        function_choices = gr.update()
+    return (*update_logs(), function_choices)
+
+@lru_cache(maxsize=1)
+def _load_css() -> str:
+    """Read and minify the application stylesheet once per process.
+    
+    Returns:
+        str: Minified contents of static/app.css
+    """
+    css_path = os.path.join(current_dir, "static", "app.css")
+    with open(css_path, "r", encoding="utf-8") as f:
+        return minify_css(f.read())
 
 # Create Gradio interface using Blocks
 with gr.Blocks(
     theme=gr.themes.Default(),
-    css=config.CSS,
+    css=_load_css(),
     analytics_enabled=False,
     mode="blocks"
 ) as demo:
@@ -834,7 +932,7 @@ with gr.Blocks(
                 theme = gr.Textbox(label="Theme", placeholder="Enter the theme...")
                 subject = gr.Textbox(label="Subject", placeholder="Enter the subject...")
                 template_name = gr.Dropdown(
-                    choices=list(config.get_instance().get_templates().keys()),
+                    choices=[],
                     label="Template",
                     value="Study Guide"
                 )
@@ -867,13 +965,12 @@ with gr.Blocks(
             with gr.Column():
                 with gr.Tabs():
                     with gr.TabItem("Rendered Output"):
-                        cheatsheet_loading = gr.Markdown("", elem_classes="loading-text")
                         output = gr.Markdown(label="Generated Cheatsheet")
                     with gr.TabItem("Raw Text"):
                         raw_output = gr.Code(label="Raw Markdown", language="markdown")
 
     with gr.Tab("Templates"):
-        gr.Markdown("<h1 style='text-align: center; font-size: 32px; margin-bottom: 30px;'>Template Management</h1>")
+        gr.Markdown("<h1 class='section-title'>Template Management</h1>")
         
         with gr.Row():
             with gr.Column(scale=2):
@@ -901,6 +998,8 @@ with gr.Blocks(
                     value=None,
                     interactive=True
                 )
+                # Key of the selector choices this session shows, to skip resending them
+                template_choices_key = gr.State(None)
                 
                 # Template List
                 template_list = gr.Dataframe(
@@ -960,8 +1059,10 @@ with gr.Blocks(
                 template_preview = gr.Markdown(label="Template Preview")
 
     with gr.Tab("Interactive Learning"):
-        gr.Markdown("<h1 style='text-align: center; font-size: 32px; margin-bottom: 30px;'>Interactive Learning Features</h1>")
-        gr.Markdown("<p style='text-align: center; color: #666;'>Generate a cheatsheet first to use these features</p>")
+        gr.Markdown("<h1 class='section-title'>Interactive Learning Features</h1>")
+        gr.Markdown("<p class='section-subtitle'>Generate a cheatsheet first to use these features</p>")
+        with gr.Row():
+            generate_all_btn = gr.Button("Generate All Study Aids", variant="primary", scale=1)
         
         # Quiz Section
         with gr.Column(elem_classes="feature-section"):
@@ -997,12 +1098,11 @@ with gr.Blocks(
                 generate_quiz_btn = gr.Button("Generate Quiz", scale=1)
             with gr.Tabs():
                 with gr.TabItem("Rendered Output"):
-                    quiz_loading = gr.Markdown("", elem_classes="loading-text")
                     quiz_output = gr.Markdown(label="Generated Quiz")
                 with gr.TabItem("Raw Text"):
                     raw_quiz_output = gr.Code(label="Raw Markdown", language="markdown")
         
-        gr.Markdown("<hr style='border: 2px solid #ddd; margin: 30px 0;'>")
+        gr.Markdown("<hr class='section-divider'>")
         
         # Flashcards Section
         with gr.Column(elem_classes="feature-section"):
@@ -1026,12 +1126,11 @@ with gr.Blocks(
                 generate_flashcards_btn = gr.Button("Generate Flashcards", scale=1)
             with gr.Tabs():
                 with gr.TabItem("Rendered Output"):
-                    flashcard_loading = gr.Markdown("", elem_classes="loading-text")
                     flashcard_output = gr.Markdown(label="Generated Flashcards")
                 with gr.TabItem("Raw Text"):
                     raw_flashcard_output = gr.Code(label="Raw Markdown", language="markdown")
         
-        gr.Markdown("<hr style='border: 2px solid #ddd; margin: 30px 0;'>")
+        gr.Markdown("<hr class='section-divider'>")
         
         # Practice Problems Section
         with gr.Column(elem_classes="feature-section"):
@@ -1061,14 +1160,13 @@ with gr.Blocks(
                 generate_problems_btn = gr.Button("Generate Practice Problems", scale=1)
             with gr.Tabs():
                 with gr.TabItem("Rendered Output"):
-                    problem_loading = gr.Markdown("", elem_classes="loading-text")
                     problem_output = gr.Markdown(label="Generated Problems")
                 with gr.TabItem("Raw Text"):
                     raw_problem_output = gr.Code(label="Raw Markdown", language="markdown")
     
     with gr.Tab("AI-Enhanced Content"):
-        gr.Markdown("<h1 style='text-align: center; font-size: 32px; margin-bottom: 30px;'>AI-Enhanced Content</h1>")
-        gr.Markdown("<p style='text-align: center; color: #666;'>Generate a cheatsheet first to use these features</p>")
+        gr.Markdown("<h1 class='section-title'>AI-Enhanced Content</h1>")
+        gr.Markdown("<p class='section-subtitle'>Generate a cheatsheet first to use these features</p>")
         
         # Smart Summarization Section
         with gr.Column(elem_classes="feature-section"):
@@ -1096,13 +1194,12 @@ with gr.Blocks(
                 generate_summary_btn = gr.Button("Generate Summary", scale=1)
             with gr.Tabs():
                 with gr.TabItem("Rendered Output"):
-                    summary_loading = gr.Markdown("", elem_classes="loading-text")
                     summary_output = gr.Markdown(label="Generated Summary")
                 with gr.TabItem("Raw Text"):
                     raw_summary_output = gr.Code(label="Raw Markdown", language="markdown")
     
-    with gr.Tab("Debug Analytics", elem_classes="debug-analytics"):
-        gr.Markdown("<h1 style='text-align: center; margin-bottom: 32px;'>Debug Analytics</h1>")
+    with gr.Tab("Debug Analytics", elem_classes="debug-analytics") as analytics_tab:
+        gr.Markdown("<h1 class='analytics-title'>Debug Analytics</h1>")
         
         # Token Usage Monitor Section
         with gr.Column(elem_classes="token-monitor"):
@@ -1115,15 +1212,17 @@ with gr.Blocks(
                         clear_filters = gr.Button("❌ Clear Filters", elem_classes="action-button")
             
             token_usage_table = gr.Dataframe(
-                headers=["Time", "Function", "Prompt Tokens", "Completion Tokens", "Total Tokens", "Cost"],
+                headers=LOG_TABLE_HEADERS,
+                datatype=["str", "str", "number", "number", "number", "number"],
                 row_count=10,
                 col_count=(6, "fixed"),
                 interactive=False,
-                wrap=True,
+                wrap=False,
                 elem_classes="usage-table"
             )
+            result_page_info = gr.Markdown("")
             
-            gr.Markdown("<h2 style='text-align: center; margin: 32px 0 24px;'>Usage Overview</h2>")
+            gr.Markdown("<h2 class='analytics-subtitle'>Usage Overview</h2>")
             with gr.Row(elem_classes="usage-overview"):
                 with gr.Column():
                     with gr.Row():
@@ -1134,22 +1233,22 @@ with gr.Blocks(
                     with gr.Row():
                         # Stats Overview Section (Left Column)
                         with gr.Column(scale=1, elem_classes="stats-overview"):
-                            total_stats = gr.Markdown("""
-                            | Metric | Value |
-                            |--------|-------|
-                            | Total Tokens | 0 |
-                            | Total Cost | $0.00 |
-                            | Avg Tokens/Call | 0 |
-                            | Avg Cost/Call | $0.00 |
-                            """)
+                            total_stats = gr.Dataframe(
+                                headers=STATS_TABLE_HEADERS,
+                                value=EMPTY_STATS_TABLE,
+                                datatype=["str", "str"],
+                                row_count=(4, "fixed"),
+                                col_count=(2, "fixed"),
+                                interactive=False
+                            )
                         
                         # Usage by Function Section (Right Column)
                         with gr.Column(scale=1, elem_classes="usage-details"):
-                            usage_by_function = gr.Markdown("No usage data available by function")
+                            usage_by_function = gr.Markdown(NO_USAGE_BY_FUNCTION)
 
         # Query Builder Section
         with gr.Column(elem_classes="query-builder"):
-            gr.Markdown("<h2 style='text-align: center; margin: 32px 0 24px;'>Query Builder</h2>")
+            gr.Markdown("<h2 class='analytics-subtitle'>Query Builder</h2>")
             with gr.Tabs() as query_tabs:
                 with gr.TabItem("Smart Filter"):
                     with gr.Row():
@@ -1170,7 +1269,7 @@ with gr.Blocks(
                             gr.Markdown("🔍 Function Filter")
                             function_dropdown = gr.Dropdown(
                                 label="Select Function",
-                                choices=get_unique_functions(),
+                                choices=[],
                                 multiselect=False
                             )
                         
@@ -1205,8 +1304,29 @@ with gr.Blocks(
                                 step=10,
                                 label="Result Limit"
                             )
+                        with gr.Column(scale=1):
+                            result_page = gr.Number(
+                                label="Page",
+                                value=0,
+                                minimum=0,
+                                precision=0
+                            )
+                        with gr.Column(scale=1):
+                            result_page_size = gr.Number(
+                                label="Page Size",
+                                value=50,
+                                minimum=1,
+                                precision=0
+                            )
                         with gr.Column(scale=1):
                             apply_smart_filter = gr.Button("🔍 Apply Smart Filter", variant="primary", elem_classes="filter-button")
+                    
+                    with gr.Row(elem_classes="action-buttons"):
+                        prev_page_btn = gr.Button("◀ Previous Page", elem_classes="action-button")
+                        next_page_btn = gr.Button("Next Page ▶", elem_classes="action-button")
+                        export_logs_btn = gr.Button("📥 Export CSV", elem_classes="action-button")
+                    
+                    export_file = gr.File(label="Exported Logs", interactive=False)
 
     with gr.Tab("About"):
         with gr.Column():
@@ -1328,155 +1448,22 @@ with gr.Blocks(
                         """
                     )
 
-        # CSS Styles
-        gr.Markdown(
-            """
-            <style>
-            .about-title {
-                text-align: center;
-                margin: 2em 0;
-            }
-            
-            .about-title h1 {
-                background: linear-gradient(90deg, #2563eb 0%, #4f46e5 100%);
-                -webkit-background-clip: text;
-                -webkit-text-fill-color: transparent;
-                font-size: 3em;
-                margin-bottom: 0.5em;
-            }
-            
-            .about-title h3 {
-                color: #6b7280;
-                font-size: 1.2em;
-            }
-            
-            .tech-stack-table {
-                margin-top: 1em;
-            }
-            
-            /* Gradio component overrides */
-            .gradio-container {
-                max-width: 1200px !important;
-                margin: 0 auto !important;
-            }
-            
-            .gradio-accordion {
-                border: 1px solid #e5e7eb !important;
-                border-radius: 12px !important;
-                margin: 1em 0 !important;
-            }
-            
-            .feature-tab {
-                padding: 1em !important;
-            }
-            
-            .feature-tab ul {
-                margin: 0;
-                padding-left: 1.5em;
-            }
-            
-            .feature-tab li {
-                margin: 0.5em 0;
-            }
-
-            /* Feature Section Styles */
-            .feature-section {
-                background: white;
-                border: 1px solid #e5e7eb;
-                border-radius: 12px;
-                padding: 1.5em;
-                margin-bottom: 2em;
-                box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1);
-            }
-            
-            .feature-header {
-                margin-bottom: 1.5em;
-            }
-            
-            .feature-header h2 {
-                color: #1f2937;
-                font-size: 1.8em;
-                margin-bottom: 0.3em;
-                display: flex;
-                align-items: center;
-                gap: 0.5em;
-            }
-            
-            .feature-header p {
-                color: #6b7280;
-                font-size: 1.1em;
-            }
-            
-            /* Input Component Styles */
-            .feature-input {
-                margin-bottom: 1em;
-            }
-            
-            .feature-input label {
-                font-weight: 500;
-                color: #374151;
-            }
-            
-            /* Button Styles */
-            .action-button {
-                background: linear-gradient(90deg, #2563eb 0%, #4f46e5 100%) !important;
-                color: white !important;
-                border: none !important;
-                padding: 0.8em 1.5em !important;
-                border-radius: 8px !important;
-                font-weight: 500 !important;
-                margin: 1em 0 !important;
-                transition: all 0.2s ease-in-out !important;
-            }
-            
-            .action-button:hover {
-                transform: translateY(-1px) !important;
-                box-shadow: 0 4px 6px rgba(37, 99, 235, 0.2) !important;
-            }
-            
-            /* Output Section Styles */
-            .output-tabs {
-                margin-top: 1.5em;
-            }
-            
-            .output-content {
-                background: #f9fafb;
-                border: 1px solid #e5e7eb;
-                border-radius: 8px;
-                padding: 1em;
-                margin-top: 1em;
-            }
-            </style>
-            """
-        )
-
     # Event handlers for the buttons
-    def show_loading(loading_component, message):
-        return gr.update(value=message, visible=True)
-
-    def hide_loading(loading_component):
-        return gr.update(value="", visible=False)
-
     generate_btn.click(
-        fn=lambda: show_loading(cheatsheet_loading, "🔄 Generating cheatsheet..."),
-        inputs=[],
-        outputs=[cheatsheet_loading]
-    ).then(
         generate_cheatsheet_and_summarize,
         inputs=[
             prompt, theme, subject, template_name, style,
             exemplified, complexity, audience, enforce_formatting
         ],
-        outputs=[output, raw_output, summarized_content]
-    ).then(
-        fn=lambda: hide_loading(cheatsheet_loading),
-        inputs=[],
-        outputs=[cheatsheet_loading]
+        outputs=[output, raw_output, summarized_content],
+        concurrency_limit=LLM_CONCURRENCY_LIMIT,
+        concurrency_id=LLM_CONCURRENCY_ID
     )
 
     # Template Management Event Handlers
     def refresh_templates():
-        """Refresh the template list."""
+        """Refresh the template list, bypassing the template cache."""
+        invalidate_templates_cache()
         return update_template_list("", "all")
 
     def new_template():
@@ -1490,20 +1477,13 @@ with gr.Blocks(
             return "", "Custom", "# Enter template content in markdown format..."
         
         try:
-            # Check if it's a default template
-            default_templates = config.get_instance().get_templates()
-            if template_name in default_templates:
-                return template_name, "Default", default_templates[template_name]["structure"]
-            
-            # Get template from database
-            db = DatabaseInstance.get_instance()
-            templates = db.get_all_templates()
-            
-            # Find the template by name
-            template = next((t for t in templates if t['name'] == template_name), None)
+            # Get template from the cached template list
+            template = get_cached_template(template_name)
             
             if template:
-                return template['name'], template['type'], template['structure']
+                # Templates seeded from the defaults are edited as Default templates
+                template_type = "Default" if template_name in config.get_default_templates() else template['type']
+                return template['name'], template_type, template['structure']
             else:
                 return template_name, "Custom", "# Template Content"
         except Exception as e:
@@ -1520,37 +1500,48 @@ with gr.Blocks(
             gr.update(visible=False)
         )
 
-    def preview_template(content):
-        """Preview template content."""
+    def preview_template(content, current_preview):
+        """Preview template content.
+        
+        Args:
+            content: Template content from the editor
+            current_preview: Content currently shown in the preview
+            
+        Returns:
+            The content to preview, or a no-op update when it is already shown
+        """
         if not content:
             return "No content to preview"
+        # Skip the re-render when the preview already shows this content
+        if content == current_preview:
+            return gr.update()
         return content
 
-    # Search and filter event handlers
-    template_search.change(
-        fn=update_template_list,
-        inputs=[template_search, template_filter],
-        outputs=[template_list, template_selector]
-    )
-    
-    template_filter.change(
-        fn=update_template_list,
-        inputs=[template_search, template_filter],
-        outputs=[template_list, template_selector]
+    # Search and filter share one event; with always_last, changes made while a
+    # query runs are coalesced into a single follow-up query with the latest values
+    gr.on(
+        triggers=[template_search.change, template_filter.change],
+        fn=run_in_thread(update_template_list),
+        inputs=[template_search, template_filter, template_choices_key],
+        outputs=[template_list, template_selector, template_choices_key],
+        trigger_mode="always_last",
+        show_progress="hidden"
     )
     
     # Refresh templates button
     refresh_templates_btn.click(
-        fn=lambda: update_template_list("", "all"),
+        fn=refresh_templates,
         inputs=[],
-        outputs=[template_list, template_selector]
+        outputs=[template_list, template_selector, template_choices_key],
+        concurrency_limit=None
     )
 
     # New template button
     new_template_btn.click(
         fn=new_template,
         inputs=[],
-        outputs=[template_editor_name, template_editor_type, template_editor_content]
+        outputs=[template_editor_name, template_editor_type, template_editor_content],
+        concurrency_limit=None
     )
 
     # Edit template button
@@ -1571,431 +1562,182 @@ with gr.Blocks(
     confirm_delete_btn.click(
         fn=confirm_delete,
         inputs=[template_selector],
-        outputs=[template_preview, template_list, template_selector, delete_confirmation, delete_confirm_row, delete_confirm_row]
+        outputs=[template_preview, template_list, template_selector, delete_confirmation, delete_confirm_row, delete_confirm_row, template_choices_key, template_name]
     )
     
     # Cancel delete button
     cancel_delete_btn.click(
         fn=cancel_delete,
         inputs=[],
-        outputs=[template_preview, delete_confirmation, delete_confirm_row, delete_confirm_row, confirm_delete_btn]
+        outputs=[template_preview, delete_confirmation, delete_confirm_row, delete_confirm_row, confirm_delete_btn],
+        concurrency_limit=None
     )
 
     # Save template button
     save_template_btn.click(
         fn=save_template,
         inputs=[template_editor_name, template_editor_type, template_editor_content],
-        outputs=[template_preview, template_list, template_selector]
-    ).then(
-        fn=update_template_dropdown,
-        inputs=[],
-        outputs=[template_name]
+        outputs=[template_preview, template_list, template_selector, template_choices_key, template_name]
     )
 
     # Preview template button
     preview_template_btn.click(
         fn=preview_template,
-        inputs=[template_editor_content],
-        outputs=[template_preview]
+        inputs=[template_editor_content, template_preview],
+        outputs=[template_preview],
+        concurrency_limit=None
     )
 
-    # Initialize template list with initial data
-    template_list.value, template_selector.value = update_template_list("", "all")
+    # Populate the template list and dropdowns on page load rather than while building
+    # the UI; this also picks up defaults added by the background migration
+    demo.load(
+        fn=lambda: (*update_template_list("", "all"), update_template_dropdown()),
+        outputs=[template_list, template_selector, template_choices_key, template_name]
+    )
 
-    # Initialize template dropdown with all templates
-    template_name.value = update_template_dropdown()
+    def select_template_row(evt: gr.SelectData):
+        """Select the template whose name cell was clicked in the template list."""
+        # Only the Name column identifies a template
+        if evt.index[1] != 0:
+            return gr.update()
+        return evt.value
 
-    # Make sure the template list is properly set up for selection
+    # Clicking a template name selects it, without sending the table back and forth
     template_list.select(
-        fn=lambda x: x,  # Just pass through the selection
-        inputs=[template_list],
-        outputs=[template_list]
+        fn=select_template_row,
+        inputs=None,
+        outputs=[template_selector],
+        show_progress="hidden"
     )
 
     # Quiz generation event handler
     generate_quiz_btn.click(
-        fn=lambda: show_loading(quiz_loading, "🔄 Generating quiz..."),
-        inputs=[],
-        outputs=[quiz_loading]
-    ).then(
         quiz_with_check,
         inputs=[summarized_content, quiz_type, difficulty, quiz_count],
-        outputs=[quiz_output, raw_quiz_output]
-    ).then(
-        fn=lambda: hide_loading(quiz_loading),
-        inputs=[],
-        outputs=[quiz_loading]
+        outputs=[quiz_output, raw_quiz_output],
+        concurrency_limit=LLM_CONCURRENCY_LIMIT,
+        concurrency_id=LLM_CONCURRENCY_ID
     )
 
     # Flashcard generation event handler
     generate_flashcards_btn.click(
-        fn=lambda: show_loading(flashcard_loading, "🔄 Generating flashcards..."),
-        inputs=[],
-        outputs=[flashcard_loading]
-    ).then(
         flashcards_with_check,
         inputs=[summarized_content, flashcard_count],
-        outputs=[flashcard_output, raw_flashcard_output]
-    ).then(
-        fn=lambda: hide_loading(flashcard_loading),
-        inputs=[],
-        outputs=[flashcard_loading]
+        outputs=[flashcard_output, raw_flashcard_output],
+        concurrency_limit=LLM_CONCURRENCY_LIMIT,
+        concurrency_id=LLM_CONCURRENCY_ID
     )
 
     # Practice problems generation event handler
     generate_problems_btn.click(
-        fn=lambda: show_loading(problem_loading, "🔄 Generating practice problems..."),
-        inputs=[],
-        outputs=[problem_loading]
-    ).then(
         problems_with_check,
         inputs=[summarized_content, problem_type, problem_count],
-        outputs=[problem_output, raw_problem_output]
-    ).then(
-        fn=lambda: hide_loading(problem_loading),
-        inputs=[],
-        outputs=[problem_loading]
+        outputs=[problem_output, raw_problem_output],
+        concurrency_limit=LLM_CONCURRENCY_LIMIT,
+        concurrency_id=LLM_CONCURRENCY_ID
     )
 
     # Summary generation event handler
     generate_summary_btn.click(
-        fn=lambda: show_loading(summary_loading, "🔄 Generating summary..."),
-        inputs=[],
-        outputs=[summary_loading]
-    ).then(
         summary_with_check,
         inputs=[summarized_content, summary_level, summary_focus],
-        outputs=[summary_output, raw_summary_output]
-    ).then(
-        fn=lambda: hide_loading(summary_loading),
-        inputs=[],
-        outputs=[summary_loading]
+        outputs=[summary_output, raw_summary_output],
+        concurrency_limit=LLM_CONCURRENCY_LIMIT,
+        concurrency_id=LLM_CONCURRENCY_ID
     )
 
-    # Update the click handlers for filtering
-    apply_smart_filter.click(
-        fn=apply_combined_filters,
+    # Generate every study aid at once, running the requests concurrently
+    generate_all_btn.click(
+        generate_all_study_aids,
         inputs=[
-            start_date, end_date,
-            function_dropdown,
-            min_tokens, max_tokens,
-            min_cost, max_cost,
-            result_limit
+            summarized_content, quiz_type, difficulty, quiz_count,
+            flashcard_count, problem_type, problem_count,
+            summary_level, summary_focus
+        ],
+        outputs=[
+            quiz_output, raw_quiz_output,
+            flashcard_output, raw_flashcard_output,
+            problem_output, raw_problem_output,
+            summary_output, raw_summary_output
         ],
-        outputs=[token_usage_table, total_stats]
+        concurrency_limit=LLM_CONCURRENCY_LIMIT,
+        concurrency_id=LLM_CONCURRENCY_ID
+    )
+
+    smart_filter_inputs = [
+        start_date, end_date,
+        function_dropdown,
+        min_tokens, max_tokens,
+        min_cost, max_cost,
+        result_limit,
+        result_page, result_page_size
+    ]
+    filter_result_outputs = [token_usage_table, result_page_info, total_stats, usage_by_function]
+
+    # Update the click handlers for filtering
+    apply_smart_filter.click(
+        fn=run_in_thread(apply_combined_filters),
+        inputs=smart_filter_inputs,
+        outputs=[result_page] + filter_result_outputs
     )
 
-    # Update the refresh logs handler
+    # Page through the filtered results without sending every row to the browser
+    prev_page_btn.click(
+        fn=run_in_thread(change_filter_page(-1)),
+        inputs=smart_filter_inputs,
+        outputs=[result_page, token_usage_table, result_page_info]
+    )
+    next_page_btn.click(
+        fn=run_in_thread(change_filter_page(1)),
+        inputs=smart_filter_inputs,
+        outputs=[result_page, token_usage_table, result_page_info]
+    )
+
+    # Refresh the logs, statistics and function filter with a single request
     refresh_logs.click(
-        fn=update_logs,
-        outputs=[token_usage_table, total_stats, usage_by_function]
+        fn=run_in_thread(refresh_analytics),
+        outputs=[token_usage_table, result_page_info, total_stats, usage_by_function, function_dropdown]
     )
 
     # Update the clear filters handler
+    # Resetting only returns constants, so it bypasses the queue and never waits behind generations
     clear_filters.click(
-        lambda: (
-            [],  # Empty table
-            EMPTY_STATS_TABLE,  # Reset stats
-        ),
-        outputs=[token_usage_table, total_stats]
+        lambda: CLEARED_FILTER_RESULTS,
+        outputs=filter_result_outputs,
+        queue=False
     ).then(
         # Reset filter inputs
-        lambda: (
-            "",  # start_date
-            "",  # end_date
-            None,  # function_dropdown
-            0,  # min_tokens
-            10000,  # max_tokens
-            0,  # min_cost
-            1,  # max_cost
-            100,  # result_limit
-        ),
-        outputs=[
-            start_date, end_date,
-            function_dropdown,
-            min_tokens, max_tokens,
-            min_cost, max_cost,
-            result_limit
-        ]
+        lambda: CLEAR_FILTERS_DEFAULTS,
+        outputs=smart_filter_inputs,
+        queue=False
+    )
+
+    # Export the filtered logs without loading them all at once
+    export_logs_btn.click(
+        fn=run_in_thread(export_logs),
+        inputs=smart_filter_inputs[:-2],
+        outputs=[export_file]
     )
 
     refresh_function_usage.click(
-        update_usage_by_function,
+        run_in_thread(update_usage_by_function),
         outputs=[usage_by_function, total_stats]
     )
 
-    # Update function dropdown choices when logs are refreshed
-    refresh_logs.click(
-        lambda: gr.Dropdown(choices=get_unique_functions()),
-        outputs=function_dropdown
+    # Load the function filter choices the first time the analytics tab is opened,
+    # so neither building the UI nor loading the page queries the logs
+    function_choices_loaded = gr.State(False)
+    analytics_tab.select(
+        run_in_thread(load_function_choices),
+        inputs=[function_choices_loaded],
+        outputs=[function_dropdown, function_choices_loaded],
+        show_progress="hidden"
     )
 
-    # Add CSS for better styling
-    gr.Markdown("""
-    <style>
-    .gradio-container {
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
-    }
-    
-    h1 {
-        font-size: 2.5em;
-        font-weight: 600;
-        margin-bottom: 1em;
-    }
-    
-    h2 {
-        font-size: 1.8em;
-        font-weight: 500;
-        margin: 0;
-        padding: 0;
-    }
-
-    h3 {
-        font-size: 1.4em;
-        font-weight: 500;
-        margin: 0;
-        padding: 0;
-    }
-    
-    /* Debug Analytics specific styles */
-    .debug-analytics {
-        padding: 20px;
-    }
-
-    .debug-analytics .token-monitor {
-        margin-bottom: 32px;
-    }
-
-    .debug-analytics h1 {
-        color: #111827;
-        font-size: 2em;
-        font-weight: 600;
-    }
-
-    .debug-analytics h2 {
-        color: #1f2937;
-        font-size: 1.5em;
-        font-weight: 600;
-    }
-
-    .debug-analytics .action-buttons {
-        display: flex;
-        justify-content: flex-end;
-        gap: 12px;
-        margin: 8px 0;
-    }
-
-    .debug-analytics .action-button {
-        min-width: 120px !important;
-        height: 36px !important;
-        border-radius: 6px !important;
-        background-color: #f3f4f6 !important;
-        border: 1px solid #e5e7eb !important;
-        color: #374151 !important;
-        font-weight: 500 !important;
-        transition: all 0.2s ease-in-out;
-    }
-
-    .debug-analytics .action-button:hover {
-        background-color: #e5e7eb !important;
-        border-color: #d1d5db !important;
-    }
-
-    .debug-analytics .usage-overview {
-        padding: 24px;
-        background-color: #f9fafb;
-        border-radius: 12px;
-        box-shadow: 0 2px 4px rgba(0, 0, 0, 0.05);
-    }
-
-    .debug-analytics .usage-overview h3 {
-        margin-bottom: 20px;
-        color: #111827;
-        font-size: 1.5em;
-        font-weight: 600;
-    }
-
-    .debug-analytics .usage-overview .markdown {
-        margin: 12px 0;
-        padding: 16px;
-        background-color: white;
-        border-radius: 8px;
-        border: 1px solid #e5e7eb;
-        transition: all 0.2s ease-in-out;
-        box-shadow: 0 1px 2px rgba(0, 0, 0, 0.05);
-    }
-
-    .debug-analytics .usage-overview .markdown:hover {
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.05);
-        transform: translateY(-2px);
-    }
-
-    .debug-analytics .usage-overview .markdown h3 {
-        color: #374151;
-        font-weight: 600;
-        font-size: 0.9em;
-        margin-bottom: 8px;
-    }
-
-    .debug-analytics .usage-overview .markdown p {
-        color: #2563eb;
-        font-weight: 600;
-        font-size: 1.2em;
-        margin: 0;
-    }
-
-    .debug-analytics .usage-overview .markdown table {
-        width: 100%;
-        border-collapse: collapse;
-        margin: 16px 0;
-    }
-
-    .debug-analytics .usage-overview .markdown th {
-        background-color: #f3f4f6;
-        padding: 12px;
-        text-align: left;
-        font-weight: 500;
-        color: #374151;
-        border-bottom: 2px solid #e5e7eb;
-    }
-
-    .debug-analytics .usage-overview .markdown td {
-        padding: 12px;
-        border-bottom: 1px solid #e5e7eb;
-        color: #4b5563;
-    }
-
-    .debug-analytics .usage-overview .markdown tr:hover {
-        background-color: #f9fafb;
-    }
-
-    .debug-analytics .query-builder {
-        margin-top: 32px;
-    }
-
-    .debug-analytics .filter-button {
-        width: 100% !important;
-        height: 40px !important;
-        margin-top: 24px !important;
-    }
-
-    /* General component styles */
-    .tabs {
-        margin-top: 1em;
-    }
-    
-    button {
-        border-radius: 6px !important;
-        font-weight: 500 !important;
-        height: 40px !important;
-        min-width: 120px !important;
-    }
-    
-    button[variant="primary"] {
-        background-color: #2563eb !important;
-        color: white !important;
-    }
-    
-    .dataframe {
-        border-radius: 8px;
-        overflow: hidden;
-        margin: 1em 0;
-    }
-    
-    .dataframe th {
-        background-color: #f3f4f6;
-        padding: 12px;
-        text-align: left;
-        font-weight: 500;
-    }
-    
-    .dataframe td {
-        padding: 12px;
-        border-bottom: 1px solid #e5e7eb;
-    }
-    
-    .markdown-body {
-        padding: 1em;
-        background-color: #f9fafb;
-        border-radius: 8px;
-        margin: 1em 0;
-    }
-    
-    /* Loading indicator styles */
-    .loading-text {
-        padding: 12px;
-        margin-bottom: 12px;
-        background-color: #eef2ff;
-        border-radius: 6px;
-        color: #4f46e5;
-        font-weight: 500;
-        animation: pulse 2s infinite;
-    }
-    
-    @keyframes pulse {
-        0% { opacity: 1; }
-        50% { opacity: 0.6; }
-        100% { opacity: 1; }
-    }
-
-    .debug-analytics .stats-overview {
-        margin: 0;
-        padding-right: 12px;
-    }
-
-    .debug-analytics .usage-details {
-        margin: 0;
-        padding-left: 12px;
-    }
-
-    .debug-analytics .stats-overview .markdown,
-    .debug-analytics .usage-details .markdown {
-        height: 100%;
-        background-color: white;
-        border-radius: 8px;
-        border: 1px solid #e5e7eb;
-        box-shadow: 0 1px 2px rgba(0, 0, 0, 0.05);
-        padding: 16px;
-    }
-
-    .debug-analytics .stats-overview table,
-    .debug-analytics .usage-details table {
-        width: 100%;
-        border-collapse: collapse;
-    }
-
-    .debug-analytics .stats-overview th,
-    .debug-analytics .usage-details th {
-        background-color: #f3f4f6;
-        padding: 12px;
-        text-align: left;
-        font-weight: 500;
-        color: #374151;
-        border-bottom: 2px solid #e5e7eb;
-    }
-
-    .debug-analytics .stats-overview td,
-    .debug-analytics .usage-details td {
-        padding: 12px;
-        border-bottom: 1px solid #e5e7eb;
-    }
-
-    .debug-analytics .stats-overview td:first-child {
-        font-weight: 500;
-        color: #374151;
-        width: 40%;
-    }
-
-    .debug-analytics .stats-overview td:last-child {
-        color: #2563eb;
-        font-weight: 500;
-    }
-
-    .debug-analytics .usage-details tr:hover {
-        background-color: #f9fafb;
-    }
-    </style>
-    """)
+
+# Queue events so concurrent users are scheduled fairly and the backlog stays bounded
+demo.queue(default_concurrency_limit=QUEUE_DEFAULT_CONCURRENCY_LIMIT, max_size=QUEUE_MAX_SIZE)
+
 
 if __name__ == "__main__":
     demo.launch(share=False)
@@ -8,7 +8,7 @@ if parent_dir not in sys.path:
     sys.path.append(parent_dir)
 
 from src.database.chroma_db import ChromaDatabase
-from src.core.generators import TokenUsageTracker
+from src.core.generators import TokenUsageTracker, invalidate_functions_cache
 from src.utils.logger import get_logger
 
 # Get logger instance
@@ -17,6 +17,10 @@ logger = get_logger(__name__)
 def reset_token_logs():
     """Reset the token logs collection and clear all caches."""
     try:
+        # Write any buffered log entries so they are not added after the reset
+        token_tracker = TokenUsageTracker()
+        token_tracker.flush()
+        
         # Initialize database
         db = ChromaDatabase()
         logger.info("Chroma database initialized successfully")
@@ -30,8 +34,8 @@ def reset_token_logs():
         logger.info("Templates collection reset successfully")
         
         # Clear TokenUsageTracker cache
-        token_tracker = TokenUsageTracker()
         token_tracker._clear_cache()
+        invalidate_functions_cache()
         logger.info("Token usage tracker cache cleared successfully")
         
         # Clear thread-local storage and collection cache
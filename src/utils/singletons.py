@@ -1,36 +1,70 @@
-from typing import Optional
-from langchain_openai import ChatOpenAI
+from typing import Optional, TYPE_CHECKING
 from ..config.config import config
-from ..database.chroma_db import ChromaDatabase
 import threading
 
+if TYPE_CHECKING:
+    import httpx
+    from langchain_openai import ChatOpenAI
+    from ..database.chroma_db import ChromaDatabase
+
+# Connection pool limits for the HTTP client shared by all OpenAI requests
+HTTP_MAX_CONNECTIONS = 64
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 32
+HTTP_TIMEOUT_SECONDS = 600.0  # Same as the OpenAI SDK default
+
 class OpenAIClient:
-    _instance: Optional[ChatOpenAI] = None
+    _instance: Optional['ChatOpenAI'] = None
+    _http_client: Optional['httpx.Client'] = None
+    _http_async_client: Optional['httpx.AsyncClient'] = None
     _lock = threading.Lock()
     
     @classmethod
-    def get_instance(cls) -> ChatOpenAI:
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    api_key = config.get_api_key()
-                    if not api_key:
-                        raise ValueError("OPENAI_API_KEY environment variable is not set")
-                    cls._instance = ChatOpenAI(
-                        model=config.get_model_name(), 
-                        api_key=api_key, 
-                        temperature=config.get_temperature()
-                    )
-        return cls._instance
+    def get_instance(cls) -> 'ChatOpenAI':
+        # Read the attribute once; after initialisation no lock is taken
+        instance = cls._instance
+        if instance is not None:
+            return instance
+        with cls._lock:
+            if cls._instance is None:
+                # Imported here so importing this module stays cheap
+                import httpx
+                from langchain_openai import ChatOpenAI
+                
+                api_key = config.get_api_key()
+                if not api_key:
+                    raise ValueError("OPENAI_API_KEY environment variable is not set")
+                # Pooled HTTP clients so the SSL context and connections are reused
+                limits = httpx.Limits(
+                    max_connections=HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS
+                )
+                cls._http_client = httpx.Client(timeout=HTTP_TIMEOUT_SECONDS, limits=limits)
+                cls._http_async_client = httpx.AsyncClient(timeout=HTTP_TIMEOUT_SECONDS, limits=limits)
+                cls._instance = ChatOpenAI(
+                    model=config.get_model_name(), 
+                    api_key=api_key, 
+                    temperature=config.get_temperature(),
+                    http_client=cls._http_client,
+                    http_async_client=cls._http_async_client,
+                    # Report token usage on streamed responses too
+                    stream_usage=True
+                )
+            return cls._instance
 
 class DatabaseInstance:
-    _instance: Optional[ChromaDatabase] = None
+    _instance: Optional['ChromaDatabase'] = None
     _lock = threading.Lock()
     
     @classmethod
-    def get_instance(cls) -> ChromaDatabase:
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = ChromaDatabase()
-        return cls._instance 
\ No newline at end of file
+    def get_instance(cls) -> 'ChromaDatabase':
+        # Read the attribute once; after initialisation no lock is taken
+        instance = cls._instance
+        if instance is not None:
+            return instance
+        with cls._lock:
+            if cls._instance is None:
+                # Imported here so chromadb is only loaded once a database is needed
+                from ..database.chroma_db import ChromaDatabase
+                
+                cls._instance = ChromaDatabase()
+            return cls._instance 
\ No newline at end of file
@@ -1,5 +1,6 @@
 import re
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
 from typing import Optional, Union, Tuple, List, Dict, Any
 from src.utils.logger import get_logger
 
@@ -18,42 +19,123 @@ DATE_FORMATS = [
     "%d/%m/%Y %H:%M:%S"
 ]
 
-def validate_date(date_str: str, allow_time: bool = True) -> Tuple[bool, Optional[str]]:
+# Error returned when a string matches none of DATE_FORMATS
+INVALID_DATE_FORMAT_MESSAGE = f"Invalid date format. Expected one of: {', '.join(DATE_FORMATS)}"
+
+# Field name and regex equivalent of each strptime directive used in DATE_FORMATS
+DATE_FORMAT_FIELDS = {
+    "%Y": ("year", r"\d{4}"),
+    "%m": ("month", r"\d{1,2}"),
+    "%d": ("day", r"\d{1,2}"),
+    "%H": ("hour", r"\d{1,2}"),
+    "%M": ("minute", r"\d{1,2}"),
+    "%S": ("second", r"\d{1,2}")
+}
+
+def _compile_date_formats(formats: List[str]) -> "re.Pattern[str]":
     """
-    Validate a date string against multiple formats.
+    Compile date formats into one alternation regex.
+    
+    Alternative i is wrapped in a group named f{i} and its fields are named
+    f{i}_year, f{i}_month and so on, so a single match identifies both the
+    format and its values.
     
     Args:
-        date_str: The date string to validate
+        formats: strptime-style formats using the directives in DATE_FORMAT_FIELDS
+        
+    Returns:
+        Compiled pattern, to be used with fullmatch
+    """
+    def field_group(directive: "re.Match[str]", index: int) -> str:
+        name, digits = DATE_FORMAT_FIELDS[directive.group()]
+        return f"(?P<f{index}_{name}>{digits})"
+    
+    alternatives = [
+        f"(?P<f{index}>{re.sub(r'%[YmdHMS]', lambda directive: field_group(directive, index), fmt)})"
+        for index, fmt in enumerate(formats)
+    ]
+    return re.compile("|".join(alternatives))
+
+# Combined patterns, compiled once at import; the date-only one is used when allow_time is False
+DATE_PATTERN = _compile_date_formats(DATE_FORMATS)
+DATE_ONLY_PATTERN = _compile_date_formats([fmt for fmt in DATE_FORMATS if "%H" not in fmt])
+
+# Zero-padded ISO date (YYYY-MM-DD), used with fullmatch before falling back to strptime
+ISO_DATE_PATTERN = re.compile(r"(\d{4})-(0\d|1[0-2])-([0-2]\d|3[01])")
+
+@lru_cache(maxsize=4096)
+def _match_date_formats(date_str: str, allow_time: bool) -> Optional[datetime]:
+    """
+    Parse a date string with the format of DATE_FORMATS it matches.
+    
+    Results are cached, so validate_date and parse_date only parse a given
+    string once.
+    
+    Args:
+        date_str: The date string to parse
         allow_time: Whether to allow time components in the date
         
     Returns:
-        Tuple of (is_valid, error_message)
+        datetime object if a format matches, None otherwise
+    """
+    match = (DATE_PATTERN if allow_time else DATE_ONLY_PATTERN).fullmatch(date_str)
+    if match is None:
+        return None
+        
+    # The outer group of the matched alternative closes last, so lastgroup names it
+    prefix = f"{match.lastgroup}_"
+    fields = {
+        name[len(prefix):]: int(value)
+        for name, value in match.groupdict().items()
+        if value is not None and name.startswith(prefix)
+    }
+    try:
+        return datetime(**fields)
+    except ValueError:
+        # Out-of-range values such as month 13 or February 30
+        return None
+
+def _try_parse(date_str: str, allow_time: bool) -> Tuple[Optional[datetime], Optional[str]]:
+    """
+    Validate and parse a date string in a single pass.
+    
+    Args:
+        date_str: The date string to parse
+        allow_time: Whether to allow time components in the date
+        
+    Returns:
+        Tuple of (datetime or None, error_message)
     """
     if not isinstance(date_str, str):
-        return False, "Date string must be a string"
+        return None, "Date string must be a string"
         
     date_str = date_str.strip()
     if not date_str:
-        return False, "Date string cannot be empty"
+        return None, "Date string cannot be empty"
         
-    # Try each format
-    for fmt in DATE_FORMATS:
-        try:
-            # Skip formats with time if not allowed
-            if not allow_time and "%H" in fmt:
-                continue
-                
-            dt = datetime.strptime(date_str, fmt)
-            
-            # Basic sanity checks
-            if dt.year < 1900 or dt.year > 2100:
-                return False, "Year must be between 1900 and 2100"
-                
-            return True, None
-        except ValueError:
-            continue
-            
-    return False, f"Invalid date format. Expected one of: {', '.join(DATE_FORMATS)}"
+    dt = _match_date_formats(date_str, allow_time)
+    if dt is None:
+        return None, INVALID_DATE_FORMAT_MESSAGE
+        
+    # Basic sanity checks
+    if dt.year < 1900 or dt.year > 2100:
+        return None, "Year must be between 1900 and 2100"
+        
+    return dt, None
+
+def validate_date(date_str: str, allow_time: bool = True) -> Tuple[bool, Optional[str]]:
+    """
+    Validate a date string against multiple formats.
+    
+    Args:
+        date_str: The date string to validate
+        allow_time: Whether to allow time components in the date
+        
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    dt, error = _try_parse(date_str, allow_time)
+    return dt is not None, error
 
 def parse_date(date_str: str, allow_time: bool = True) -> Optional[datetime]:
     """
@@ -66,29 +148,22 @@ def parse_date(date_str: str, allow_time: bool = True) -> Optional[datetime]:
     Returns:
         datetime object if successful, None otherwise
     """
-    is_valid, error = validate_date(date_str, allow_time)
-    if not is_valid:
+    dt, error = _try_parse(date_str, allow_time)
+    if dt is None:
         logger.warning(f"Failed to parse date: {error}")
-        return None
-        
-    for fmt in DATE_FORMATS:
-        try:
-            # Skip formats with time if not allowed
-            if not allow_time and "%H" in fmt:
-                continue
-                
-            return datetime.strptime(date_str, fmt)
-        except ValueError:
-            continue
-            
-    return None
+    return dt
 
-def format_date(date_obj: Union[datetime, str], format_str: str = "%Y-%m-%d") -> Optional[str]:
+@lru_cache(maxsize=1024)
+def _format_day(year: int, month: int, day: int, format_str: str) -> str:
+    """Format a calendar day, cached since the same few days are formatted repeatedly."""
+    return datetime(year, month, day).strftime(format_str)
+
+def format_date(date_obj: Union[datetime, date, str], format_str: str = "%Y-%m-%d") -> Optional[str]:
     """
     Format a datetime object or string into a specified format.
     
     Args:
-        date_obj: datetime object or date string
+        date_obj: datetime or date object, or date string
         format_str: Output format string
         
     Returns:
@@ -101,6 +176,16 @@ def format_date(date_obj: Union[datetime, str], format_str: str = "%Y-%m-%d") ->
                 return None
             date_obj = parsed_date
             
+        # The default ISO format is built directly instead of going through strftime
+        if format_str == "%Y-%m-%d":
+            return f"{date_obj.year:04d}-{date_obj.month:02d}-{date_obj.day:02d}"
+        # Dates without a time of day can be served from the cache
+        if type(date_obj) is date or (
+            isinstance(date_obj, datetime)
+            and date_obj.time() == datetime.min.time()
+            and date_obj.tzinfo is None
+        ):
+            return _format_day(date_obj.year, date_obj.month, date_obj.day, format_str)
         return date_obj.strftime(format_str)
     except Exception as e:
         logger.error(f"Failed to format date: {e}")
@@ -118,22 +203,15 @@ def is_valid_date_range(start_date: str, end_date: str, allow_time: bool = True)
     Returns:
         Tuple of (is_valid, error_message)
     """
-    # Validate individual dates
-    start_valid, start_error = validate_date(start_date, allow_time)
-    if not start_valid:
+    # Validate and parse each date once
+    start_dt, start_error = _try_parse(start_date, allow_time)
+    if start_dt is None:
         return False, f"Invalid start date: {start_error}"
         
-    end_valid, end_error = validate_date(end_date, allow_time)
-    if not end_valid:
+    end_dt, end_error = _try_parse(end_date, allow_time)
+    if end_dt is None:
         return False, f"Invalid end date: {end_error}"
         
-    # Parse dates for range validation
-    start_dt = parse_date(start_date, allow_time)
-    end_dt = parse_date(end_date, allow_time)
-    
-    if start_dt is None or end_dt is None:
-        return False, "Failed to parse dates for range validation"
-        
     # Validate range
     if start_dt > end_dt:
         return False, "Start date must be before or equal to end date"
@@ -150,12 +228,30 @@ def validate_date_format(date_str: str) -> bool:
     Returns:
         bool: True if valid, False otherwise
     """
+    # Reject non-strings before they reach the cache or the parsers
+    if not isinstance(date_str, str):
+        return False
+    return _validate_date_format_cached(date_str)
+
+@lru_cache(maxsize=512)
+def _validate_date_format_cached(date_str: str) -> bool:
+    """Validate a date string, caching the result per string."""
+    # Fast path for the common zero-padded YYYY-MM-DD form
+    match = ISO_DATE_PATTERN.fullmatch(date_str)
+    if match:
+        try:
+            datetime(int(match[1]), int(match[2]), int(match[3]))
+            return True
+        except ValueError:
+            return False
+    
+    # ISO is the expected input, so try the C parser before strptime
     try:
-        datetime.strptime(date_str, "%Y-%m-%d")
+        datetime.fromisoformat(date_str)
         return True
     except ValueError:
         try:
-            datetime.fromisoformat(date_str)
+            datetime.strptime(date_str, "%Y-%m-%d")
             return True
         except ValueError:
             return False
@@ -175,7 +271,7 @@ def format_date_for_display(iso_date: str) -> str:
     """
     try:
         date_obj = datetime.fromisoformat(iso_date)
-        return date_obj.strftime("%Y-%m-%d")
+        return f"{date_obj.year:04d}-{date_obj.month:02d}-{date_obj.day:02d}"
     except ValueError as e:
         logger.error(f"Invalid ISO date format: {iso_date}")
         raise ValueError(f"Invalid ISO date format: {iso_date}. Error: {str(e)}")
@@ -191,12 +287,10 @@ def validate_numeric_range(min_val: float, max_val: float) -> bool:
     Returns:
         bool: True if valid, False otherwise
     """
-    try:
-        if not isinstance(min_val, (int, float)) or not isinstance(max_val, (int, float)):
-            return False
-        return min_val <= max_val
-    except Exception:
+    # Comparing two ints or floats cannot raise, so no exception handling is needed
+    if not isinstance(min_val, (int, float)) or not isinstance(max_val, (int, float)):
         return False
+    return min_val <= max_val
 
 def validate_positive_integer(value: int) -> bool:
     """
@@ -208,7 +302,25 @@ def validate_positive_integer(value: int) -> bool:
     Returns:
         bool: True if valid, False otherwise
     """
-    try:
-        return isinstance(value, int) and value > 0
-    except Exception:
-        return False 
\ No newline at end of file
+    return isinstance(value, int) and value > 0
+
+def minify_css(css: str) -> str:
+    """
+    Minify a stylesheet by removing comments and redundant whitespace.
+    
+    Args:
+        css: Stylesheet source
+        
+    Returns:
+        str: Minified stylesheet
+    """
+    # Remove comments
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    # Collapse whitespace runs into a single space
+    css = re.sub(r"\s+", " ", css)
+    # Drop spaces around punctuation that does not need them
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    # The last declaration in a block does not need a semicolon
+    css = css.replace(";}", "}")
+    return css.strip()